@@ -16,7 +16,12 @@ REASON FOR DEPRECATION:
 AI-powered disambiguation activity supporting both LangChain (OpenAI) and Claude SDK.
 """
 
-from typing import List, Dict, Optional
+import asyncio
+import hashlib
+import heapq
+import json
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
 from temporalio import activity
 from langchain_openai import ChatOpenAI
@@ -25,6 +30,237 @@ from anthropic import AsyncAnthropic
 
 from models.data_models import SongMetadata, SpotifyTrackResult
 from config.settings import settings
+from utils.ttl_cache import TTLCache
+
+
+# Bump whenever the prompts or response handling change, so cached decisions
+# made under the old prompt are not reused
+PROMPT_VERSION = 3
+
+# Kept terse: prompt length drives time-to-first-token and cost on every call
+SYSTEM_PROMPT = """Pick the Spotify candidate that is the same recording as the Apple Music song.
+Allow artist name variants, featured artists, remasters, and single/album versions; \
+prefer studio over live unless the original is live.
+Answer with the candidate uri (or NONE if no candidate fits) and a one-sentence reason."""
+
+# Shape of a single-song answer. Both providers are constrained to it, so the
+# reply is always a parseable object rather than free text.
+MATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "uri": {"type": "string"},
+        "reason": {"type": "string"},
+    },
+    "required": ["uri", "reason"],
+    "additionalProperties": False,
+}
+
+# OpenAI structured output for MATCH_SCHEMA
+_OPENAI_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "Match", "schema": MATCH_SCHEMA, "strict": True},
+}
+
+# Claude tool whose forced call carries the answer as MATCH_SCHEMA input
+_CLAUDE_MATCH_TOOL = {
+    "name": "select_match",
+    "description": "Record the chosen Spotify candidate.",
+    "input_schema": MATCH_SCHEMA,
+}
+
+# Single-song prompt for the LangChain provider, built once
+DISAMBIGUATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", SYSTEM_PROMPT),
+        (
+            "user",
+            """Original Song:
+Title: {title}
+Artist: {artist}
+Album: {album}
+
+Spotify Candidates:
+{candidates}
+
+Which is the best match?""",
+        ),
+    ]
+)
+
+# Fixed pieces of the single-song user prompt sent to Claude
+_USER_PROMPT_PREFIX = "Original Song:\nTitle: "
+_USER_PROMPT_MID = "\n\nSpotify Candidates:\n"
+_USER_PROMPT_SUFFIX = "\n\nWhich is the best match?"
+
+# Output cap for single-song replies: a uri and a one-sentence reason
+MAX_RESPONSE_TOKENS = 128
+
+# Header for the one-row-per-candidate table built by _format_candidates
+CANDIDATES_HEADER = "#|title|artist|album|year|fuzz|pop|uri\n"
+
+# A fuzzy score this high, this far ahead of the runner-up, is decisive on its
+# own and the LLM is not consulted. The workflow only asks for AI help when
+# the best fuzzy score is below the request's match_threshold, so this fires
+# for requests with a threshold above FAST_PATH_MIN_SCORE (e.g. 0.95) and
+# never at the default of 0.85.
+FAST_PATH_MIN_SCORE = 0.92
+FAST_PATH_MIN_GAP = 0.15
+
+# Exact-match cache of LLM decisions. Calls run at temperature 0, so the same
+# song, candidates and fuzzy scores yield the same answer; retries and
+# re-synced rows skip the API call.
+AI_CACHE_TTL_SECONDS = 3600
+AI_CACHE_MAX_ENTRIES = 2048
+_ai_result_cache: "TTLCache[str, Dict]" = TTLCache(AI_CACHE_TTL_SECONDS, AI_CACHE_MAX_ENTRIES)
+
+# Requests currently being decided, by cache key. Identical concurrent
+# requests (retries, duplicate rows) await the first one's result instead of
+# each calling the LLM while the cache entry is still cold.
+_ai_inflight: "Dict[str, asyncio.Future[Dict]]" = {}
+
+
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: Optional[str]) -> AsyncAnthropic:
+    """Shared Anthropic client per API key, reusing its HTTP connection pool."""
+    return AsyncAnthropic(api_key=api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_openai_llm(model: str, api_key: Optional[str]) -> ChatOpenAI:
+    """Shared OpenAI chat model per model and API key, reusing its connection pool.
+
+    Per-call limits such as max_tokens are applied with .bind().
+    """
+    return ChatOpenAI(
+        model=model,
+        temperature=0,  # Deterministic for consistency
+        api_key=api_key,
+    )
+
+
+# A small-model NONE is second-guessed when some candidate scored this well
+ESCALATE_MIN_FUZZY_SCORE = 0.7
+
+
+def _cached_system(prompt: str) -> List[Dict]:
+    """Wrap a fixed system prompt so Anthropic caches it across calls."""
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+def _provider_models() -> Tuple[Optional[str], str]:
+    """Return the (small, large) models configured for the active provider."""
+    if settings.ai_provider == "claude":
+        return settings.claude_model_small, settings.claude_model
+    return settings.ai_model_small, settings.ai_model
+
+
+async def _call_provider(
+    original_metadata: SongMetadata,
+    candidates: List[SpotifyTrackResult],
+    fuzzy_scores: List[Dict],
+    model: str,
+) -> Dict:
+    """Route one disambiguation request to the configured provider and model."""
+    provider = _PROVIDERS.get(settings.ai_provider)
+    if provider is None:
+        raise ValueError(f"Unknown AI provider: {settings.ai_provider}")
+    return await provider(original_metadata, candidates, fuzzy_scores, model)
+
+
+def _should_escalate(result: Dict, fuzzy_scores: List[Dict]) -> bool:
+    """Decide whether a small-model answer needs a second opinion from the large model.
+
+    Args:
+        result: Match result from the small model
+        fuzzy_scores: Fuzzy matching scores for each candidate
+
+    Returns:
+        True if the answer was unusable, or if it rejected every candidate
+        although one scored at least ESCALATE_MIN_FUZZY_SCORE
+    """
+    if result["match_method"] == "ai_failed":
+        return True
+    if result["is_match"]:
+        return False
+    best_fuzzy = max((s.get("score", 0) for s in fuzzy_scores), default=0)
+    return best_fuzzy >= ESCALATE_MIN_FUZZY_SCORE
+
+
+def _dominant_fuzzy_match(
+    by_uri: Dict[str, SpotifyTrackResult], fuzzy_scores: List[Dict]
+) -> Optional[Dict]:
+    """Return the top fuzzy candidate as a match if it clearly beats the rest.
+
+    Args:
+        by_uri: Candidate Spotify tracks keyed by URI
+        fuzzy_scores: Fuzzy matching scores for each candidate
+
+    Returns:
+        Match result for the top candidate if its score is at least
+        FAST_PATH_MIN_SCORE and FAST_PATH_MIN_GAP ahead of the runner-up,
+        otherwise None
+    """
+    top = heapq.nlargest(2, fuzzy_scores, key=lambda s: s.get("score", 0))
+    if not top:
+        return None
+
+    best_score = top[0].get("score", 0)
+    runner_up = top[1].get("score", 0) if len(top) > 1 else 0.0
+    if best_score < FAST_PATH_MIN_SCORE or best_score - runner_up < FAST_PATH_MIN_GAP:
+        return None
+
+    matched_track = by_uri.get(f"spotify:track:{top[0].get('track_id')}")
+    if matched_track is None:
+        return None
+
+    return {
+        "is_match": True,
+        "confidence": best_score,
+        "matched_track": matched_track,
+        "match_method": "fuzzy_high_confidence",
+        "reasoning": "Top fuzzy match dominant",
+    }
+
+
+def _ai_cache_key(
+    original_metadata: SongMetadata,
+    candidates: List[SpotifyTrackResult],
+    fuzzy_scores: List[Dict],
+) -> str:
+    """Hash everything that can change the LLM's decision into a cache key.
+
+    Args:
+        original_metadata: Original song from Apple Music
+        candidates: List of candidate Spotify tracks
+        fuzzy_scores: Fuzzy matching scores for each candidate
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    small_model, model = _provider_models()
+    payload = {
+        "t": original_metadata.title.lower().strip(),
+        "a": original_metadata.artist.lower().strip(),
+        "al": (original_metadata.album or "").lower().strip(),
+        "c": sorted(c.spotify_uri for c in candidates),
+        "f": sorted((s.get("track_id"), round(s.get("score", 0), 2)) for s in fuzzy_scores),
+        "p": settings.ai_provider,
+        "m": model,
+        "ms": small_model,
+        "v": PROMPT_VERSION,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _get_cached_ai_result(key: str) -> Optional[Dict]:
+    """Return a copy of a cached decision, or None if missing or expired."""
+    result = _ai_result_cache.get(key)
+    return dict(result) if result is not None else None
+
+
+def _cache_ai_result(key: str, result: Dict) -> None:
+    """Store a decision, evicting the least recently used entry when full."""
+    _ai_result_cache.set(key, dict(result))
 
 
 @activity.defn(name="ai-disambiguate")
@@ -55,19 +291,318 @@ async def ai_disambiguate_track(
         f"AI disambiguating {len(candidates)} candidates for: {original_metadata} using provider: {settings.ai_provider}"
     )
 
-    # Route to appropriate provider
-    if settings.ai_provider == "langchain":
-        return await _ai_disambiguate_with_langchain(original_metadata, candidates, fuzzy_scores)
-    elif settings.ai_provider == "claude":
-        return await _ai_disambiguate_with_claude(original_metadata, candidates, fuzzy_scores)
+    return await _disambiguate_single(original_metadata, candidates, fuzzy_scores)
+
+
+async def _disambiguate_single(
+    original_metadata: SongMetadata,
+    candidates: List[SpotifyTrackResult],
+    fuzzy_scores: List[Dict],
+) -> Dict:
+    """Disambiguate one song through the configured provider, using the cache."""
+    if not candidates:
+        return {
+            "is_match": False,
+            "confidence": 0.0,
+            "matched_track": None,
+            "match_method": "ai_failed",
+            "reasoning": "No candidates provided",
+        }
+
+    dominant = _dominant_fuzzy_match({c.spotify_uri: c for c in candidates}, fuzzy_scores)
+    if dominant is not None:
+        activity.logger.info(f"Skipping AI, fuzzy match is decisive for: {original_metadata}")
+        return dominant
+
+    cache_key = _ai_cache_key(original_metadata, candidates, fuzzy_scores)
+    cached = _get_cached_ai_result(cache_key)
+    if cached is not None:
+        activity.logger.info(f"Using cached AI decision for: {original_metadata}")
+        return cached
+
+    inflight = _ai_inflight.get(cache_key)
+    if inflight is not None:
+        activity.logger.info(f"Joining in-flight AI decision for: {original_metadata}")
+        return dict(await asyncio.shield(inflight))
+
+    future: "asyncio.Future[Dict]" = asyncio.get_running_loop().create_future()
+    _ai_inflight[cache_key] = future
+    try:
+        result = await _decide_with_models(original_metadata, candidates, fuzzy_scores)
+    except BaseException as e:
+        # Waiters get a retryable error even if this activity was cancelled,
+        # rather than being cancelled along with it
+        if isinstance(e, Exception):
+            future.set_exception(e)
+        else:
+            future.set_exception(RuntimeError("Identical AI disambiguation was cancelled"))
+        future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    finally:
+        del _ai_inflight[cache_key]
+
+    # Only cache real decisions; parse failures and invalid URIs may succeed on retry
+    if result["match_method"] != "ai_failed":
+        _cache_ai_result(cache_key, result)
+
+    future.set_result(result)
+    return result
+
+
+async def _decide_with_models(
+    original_metadata: SongMetadata,
+    candidates: List[SpotifyTrackResult],
+    fuzzy_scores: List[Dict],
+) -> Dict:
+    """Ask the LLM, trying the small model first when one is configured.
+
+    Escalates to the large model when the small model's answer is unusable
+    or contradicts the fuzzy scores.
+    """
+    small_model, large_model = _provider_models()
+    if small_model and small_model != large_model:
+        result = await _call_provider(original_metadata, candidates, fuzzy_scores, small_model)
+        if _should_escalate(result, fuzzy_scores):
+            activity.logger.info(f"Escalating AI disambiguation to {large_model}")
+            result = await _call_provider(original_metadata, candidates, fuzzy_scores, large_model)
+        return result
+
+    return await _call_provider(original_metadata, candidates, fuzzy_scores, large_model)
+
+
+BATCH_SYSTEM_PROMPT = """For each Apple Music song, pick the Spotify candidate from that song's own \
+list that is the same recording.
+Allow artist name variants, featured artists, remasters, and single/album versions; \
+prefer studio over live unless the original is live. Use "NONE" if no candidate fits.
+Reply with ONLY a JSON array, one object per song:
+[{"song_index": 1, "uri": "<candidate uri or NONE>", "reason": "<one sentence>"}]"""
+
+# Output tokens budgeted per song in a batched response
+BATCH_TOKENS_PER_SONG = 128
+
+
+@activity.defn(name="ai-disambiguate-batch")
+async def ai_disambiguate_track_batch(
+    items: List[Tuple[SongMetadata, List[SpotifyTrackResult], List[Dict]]],
+) -> List[Dict]:
+    """Disambiguate several songs with a single LLM call.
+
+    Packs every song that is not already cached into one prompt, so the
+    system prompt and round-trip are paid once per batch. Songs the model
+    does not answer, or every song if the response cannot be parsed, fall
+    back to the single-song path.
+
+    Args:
+        items: (original_metadata, candidates, fuzzy_scores) per song, as
+            passed to ai_disambiguate_track
+
+    Returns:
+        One match result per item, in the same order and with the same
+        shape as ai_disambiguate_track returns
+    """
+    activity.logger.info(
+        f"AI disambiguating {len(items)} songs in one batch using provider: {settings.ai_provider}"
+    )
+
+    results: List[Optional[Dict]] = [None] * len(items)
+    pending: List[int] = []
+    cache_keys: List[str] = []
+    candidates_by_uri: List[Dict[str, SpotifyTrackResult]] = []
+    for idx, (original_metadata, candidates, fuzzy_scores) in enumerate(items):
+        cache_keys.append(_ai_cache_key(original_metadata, candidates, fuzzy_scores))
+        candidates_by_uri.append({c.spotify_uri: c for c in candidates})
+        if not candidates:
+            results[idx] = await _disambiguate_single(original_metadata, candidates, fuzzy_scores)
+            continue
+        dominant = _dominant_fuzzy_match(candidates_by_uri[idx], fuzzy_scores)
+        if dominant is not None:
+            results[idx] = dominant
+            continue
+        cached = _get_cached_ai_result(cache_keys[idx])
+        if cached is not None:
+            results[idx] = cached
+        else:
+            pending.append(idx)
+
+    if len(pending) > 1:
+        try:
+            decisions = await _request_batch_decisions([items[idx] for idx in pending])
+        except Exception as e:
+            activity.logger.warning(f"Batch AI disambiguation failed, falling back: {e}")
+            decisions = {}
+
+        match_method = "ai_claude" if settings.ai_provider == "claude" else "ai"
+        for song_index, idx in enumerate(pending, 1):
+            decision = decisions.get(song_index)
+            if decision is None:
+                continue
+            result = _decision_to_result(candidates_by_uri[idx], decision, match_method)
+            if result is not None:
+                _cache_ai_result(cache_keys[idx], result)
+                results[idx] = result
+
+    # Anything still unresolved goes through the single-song path
+    for idx in pending:
+        if results[idx] is None:
+            results[idx] = await _disambiguate_single(*items[idx])
+
+    return results
+
+
+async def _request_batch_decisions(
+    items: List[Tuple[SongMetadata, List[SpotifyTrackResult], List[Dict]]],
+) -> Dict[int, Dict]:
+    """Ask the configured provider about several songs at once.
+
+    Args:
+        items: (original_metadata, candidates, fuzzy_scores) per song
+
+    Returns:
+        Decisions ({"uri", "reason"}) keyed by 1-based song index
+
+    Raises:
+        ValueError: If the response is not a JSON array of decisions
+    """
+    user_prompt = "".join(
+        f"""=== SONG {idx} ===
+Original Song:
+Title: {original_metadata.title}
+Artist: {original_metadata.artist}
+Album: {original_metadata.album or "Unknown"}
+
+Spotify Candidates:
+{_format_candidates(candidates, fuzzy_scores)}
+"""
+        for idx, (original_metadata, candidates, fuzzy_scores) in enumerate(items, 1)
+    )
+    user_prompt += "\nWhich is the best match for each song?"
+    max_tokens = BATCH_TOKENS_PER_SONG * len(items)
+
+    if settings.ai_provider == "claude":
+        client = _get_anthropic_client(settings.anthropic_api_key)
+        response = await client.messages.create(
+            model=settings.claude_model,
+            max_tokens=max_tokens,
+            temperature=0,
+            system=_cached_system(BATCH_SYSTEM_PROMPT),
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        content = response.content[0].text
+    elif settings.ai_provider == "langchain":
+        llm = _get_openai_llm(settings.ai_model, settings.openai_api_key)
+        response = await llm.bind(max_tokens=max_tokens).ainvoke(
+            [("system", BATCH_SYSTEM_PROMPT), ("user", user_prompt)]
+        )
+        content = response.content
     else:
         raise ValueError(f"Unknown AI provider: {settings.ai_provider}")
 
+    activity.logger.debug(f"AI batch response: {content}")
+
+    # Tolerate prose or code fences around the array
+    start, end = content.find("["), content.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("AI batch response contains no JSON array")
+    entries = json.loads(content[start : end + 1])
+    if not isinstance(entries, list):
+        raise ValueError("AI batch response is not a JSON array")
+
+    decisions = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or not entry.get("uri"):
+            continue
+        if not isinstance(entry.get("song_index"), int):
+            continue
+        decisions[entry["song_index"]] = {
+            "uri": str(entry["uri"]).strip(),
+            "reason": str(entry.get("reason", "")).strip(),
+        }
+    return decisions
+
+
+def _decision_to_result(
+    by_uri: Dict[str, SpotifyTrackResult], decision: Dict, match_method: str
+) -> Optional[Dict]:
+    """Turn one batched decision into a match result.
+
+    Returns:
+        Match result, or None if the URI is not one of the song's candidates
+    """
+    selected_uri = decision["uri"]
+    if selected_uri.upper() == "NONE":
+        return {
+            "is_match": False,
+            "confidence": 0.0,
+            "matched_track": None,
+            "match_method": match_method,
+            "reasoning": decision["reason"],
+        }
+
+    matched_track = by_uri.get(selected_uri)
+    if matched_track is None:
+        activity.logger.warning(f"AI batch returned invalid URI: {selected_uri}")
+        return None
+
+    return {
+        "is_match": True,
+        "confidence": 0.90,  # AI match gets high confidence
+        "matched_track": matched_track,
+        "match_method": match_method,
+        "reasoning": decision["reason"],
+    }
+
+
+def _format_candidates(candidates: List[SpotifyTrackResult], fuzzy_scores: List[Dict]) -> str:
+    """Format candidates and their fuzzy scores as a compact table for an LLM prompt.
+
+    Only the settings.ai_max_candidates best candidates by fuzzy score are
+    listed; lower-scored ones rarely win and only add prompt tokens.
+
+    Args:
+        candidates: List of candidate Spotify tracks
+        fuzzy_scores: Fuzzy matching scores for each candidate
+
+    Returns:
+        Header line plus one pipe-separated row per listed candidate
+    """
+    score_by_id = {s.get("track_id"): s.get("score", 0) for s in fuzzy_scores}
+    ranked = sorted(candidates, key=lambda c: score_by_id.get(c.track_id, 0), reverse=True)
+    rows = [CANDIDATES_HEADER]
+    for idx, candidate in enumerate(ranked[: settings.ai_max_candidates], 1):
+        score = score_by_id.get(candidate.track_id, 0)
+        rows.append(
+            f"{idx}|{candidate.track_name}|{candidate.artist_name}|{candidate.album_name}"
+            f"|{(candidate.release_date or '')[:4]}|{score:.2f}"
+            f"|{candidate.popularity}|{candidate.spotify_uri}\n"
+        )
+    return "".join(rows)
+
+
+def _parse_response(payload: Dict, source: str) -> Tuple[str, str]:
+    """Extract the selected URI and reasoning from a single-song answer.
+
+    Args:
+        payload: Answer object produced under MATCH_SCHEMA
+        source: Provider name for the error message
+
+    Returns:
+        Tuple of (selected URI, reasoning)
+
+    Raises:
+        ValueError: If the uri or reason field is missing
+    """
+    uri = payload.get("uri") if isinstance(payload, dict) else None
+    reason = payload.get("reason") if isinstance(payload, dict) else None
+    if not isinstance(uri, str) or not uri.strip() or not isinstance(reason, str):
+        raise ValueError(f"{source} response missing uri or reason")
+    return uri.strip(), reason.strip()
+
 
 async def _ai_disambiguate_with_langchain(
     original_metadata: SongMetadata,
     candidates: List[SpotifyTrackResult],
     fuzzy_scores: List[Dict],
+    model: str,
 ) -> Dict:
     """Use LangChain (OpenAI) to choose between ambiguous matches.
 
@@ -75,92 +610,27 @@ async def _ai_disambiguate_with_langchain(
         original_metadata: Original song from Apple Music
         candidates: List of candidate Spotify tracks
         fuzzy_scores: Fuzzy matching scores for each candidate
+        model: Model to invoke
 
     Returns:
         Dictionary with match result
     """
 
-    if not candidates:
-        return {
-            "is_match": False,
-            "confidence": 0.0,
-            "matched_track": None,
-            "match_method": "ai_failed",
-            "reasoning": "No candidates provided",
-        }
+    by_uri = {c.spotify_uri: c for c in candidates}
 
     try:
         # Format candidates for LLM
-        candidates_text = ""
-        for idx, candidate in enumerate(candidates, 1):
-            # Find corresponding fuzzy score
-            fuzzy_info = next(
-                (
-                    s
-                    for s in fuzzy_scores
-                    if s.get("track", {}).get("track_id") == candidate.track_id
-                ),
-                {"score": 0},
-            )
-
-            candidates_text += f"""
-{idx}. "{candidate.track_name}" by {candidate.artist_name}
-   Album: {candidate.album_name}
-   Release Date: {candidate.release_date}
-   Fuzzy Match Score: {fuzzy_info.get('score', 0):.2f}
-   Popularity: {candidate.popularity}
-   URI: {candidate.spotify_uri}
-"""
-
-        # Create LLM prompt
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                (
-                    "system",
-                    """You are an expert music librarian helping match songs from Apple Music to Spotify.
-Given an original song and multiple Spotify candidates, select the best match.
-
-Consider these factors:
-- Artist name variations (e.g., "The Beatles" vs "Beatles")
-- Album names and release dates
-- Remaster vs original versions
-- Live vs studio recordings
-- Featured artists
-- Single vs album versions
-
-Respond with ONLY the URI of the best match and a brief reason (one sentence).
-If none of the candidates is a good match, respond with "NONE" as the URI.
-
-Format your response EXACTLY like this:
-URI: spotify:track:xxxxx (or NONE)
-REASON: Brief explanation in one sentence""",
-                ),
-                (
-                    "user",
-                    """Original Song:
-Title: {title}
-Artist: {artist}
-Album: {album}
-
-Spotify Candidates:
-{candidates}
+        candidates_text = _format_candidates(candidates, fuzzy_scores)
 
-Which is the best match?""",
-                ),
-            ]
-        )
+        # Reuse the shared LLM client, capping output for a single answer
+        llm = _get_openai_llm(model, settings.openai_api_key)
 
-        # Initialize LLM
-        llm = ChatOpenAI(
-            model=settings.ai_model,
-            temperature=0,  # Deterministic for consistency
-            api_key=settings.openai_api_key,
+        # Create chain, constraining the reply to MATCH_SCHEMA
+        chain = DISAMBIGUATION_PROMPT | llm.bind(
+            max_tokens=MAX_RESPONSE_TOKENS, response_format=_OPENAI_RESPONSE_FORMAT
         )
 
-        # Create chain and invoke
-        chain = prompt | llm
-
-        activity.logger.info(f"Invoking AI with model: {settings.ai_model}")
+        activity.logger.info(f"Invoking AI with model: {model}")
 
         response = await chain.ainvoke(
             {
@@ -172,20 +642,11 @@ Which is the best match?""",
         )
 
         # Parse response
-        content = response.content
-        activity.logger.debug(f"AI response: {content}")
+        activity.logger.debug(f"AI response: {response.content}")
 
         # Extract URI and reason
         try:
-            lines = content.strip().split("\n")
-            uri_line = next((l for l in lines if l.startswith("URI:")), None)
-            reason_line = next((l for l in lines if l.startswith("REASON:")), None)
-
-            if not uri_line or not reason_line:
-                raise ValueError("AI response missing URI or REASON")
-
-            selected_uri = uri_line.replace("URI:", "").strip()
-            reasoning = reason_line.replace("REASON:", "").strip()
+            selected_uri, reasoning = _parse_response(json.loads(response.content), "AI")
 
             # Check if AI said no match
             if selected_uri.upper() == "NONE":
@@ -199,9 +660,7 @@ Which is the best match?""",
                 }
 
             # Find matching candidate
-            matched_track = next(
-                (c for c in candidates if c.spotify_uri == selected_uri), None
-            )
+            matched_track = by_uri.get(selected_uri)
 
             if matched_track:
                 activity.logger.info(f"AI selected: {matched_track.track_name} - {reasoning}")
@@ -223,7 +682,7 @@ Which is the best match?""",
                     "reasoning": f"AI returned invalid URI: {selected_uri}",
                 }
 
-        except (ValueError, StopIteration) as e:
+        except ValueError as e:
             activity.logger.error(f"Failed to parse AI response: {e}")
             return {
                 "is_match": False,
@@ -256,6 +715,7 @@ async def _ai_disambiguate_with_claude(
     original_metadata: SongMetadata,
     candidates: List[SpotifyTrackResult],
     fuzzy_scores: List[Dict],
+    model: str,
 ) -> Dict:
     """Use Claude SDK (Anthropic) to choose between ambiguous matches.
 
@@ -263,101 +723,58 @@ async def _ai_disambiguate_with_claude(
         original_metadata: Original song from Apple Music
         candidates: List of candidate Spotify tracks
         fuzzy_scores: Fuzzy matching scores for each candidate
+        model: Model to invoke
 
     Returns:
         Dictionary with match result
     """
 
-    if not candidates:
-        return {
-            "is_match": False,
-            "confidence": 0.0,
-            "matched_track": None,
-            "match_method": "ai_failed",
-            "reasoning": "No candidates provided",
-        }
+    by_uri = {c.spotify_uri: c for c in candidates}
 
     try:
         # Format candidates for Claude
-        candidates_text = ""
-        for idx, candidate in enumerate(candidates, 1):
-            # Find corresponding fuzzy score
-            fuzzy_info = next(
-                (
-                    s
-                    for s in fuzzy_scores
-                    if s.get("track", {}).get("track_id") == candidate.track_id
-                ),
-                {"score": 0},
-            )
-
-            candidates_text += f"""
-{idx}. "{candidate.track_name}" by {candidate.artist_name}
-   Album: {candidate.album_name}
-   Release Date: {candidate.release_date}
-   Fuzzy Match Score: {fuzzy_info.get('score', 0):.2f}
-   Popularity: {candidate.popularity}
-   URI: {candidate.spotify_uri}
-"""
+        candidates_text = _format_candidates(candidates, fuzzy_scores)
 
         # Create the prompt for Claude
-        system_prompt = """You are an expert music librarian helping match songs from Apple Music to Spotify.
-Given an original song and multiple Spotify candidates, select the best match.
-
-Consider these factors:
-- Artist name variations (e.g., "The Beatles" vs "Beatles")
-- Album names and release dates
-- Remaster vs original versions
-- Live vs studio recordings
-- Featured artists
-- Single vs album versions
-
-Respond with ONLY the URI of the best match and a brief reason (one sentence).
-If none of the candidates is a good match, respond with "NONE" as the URI.
-
-Format your response EXACTLY like this:
-URI: spotify:track:xxxxx (or NONE)
-REASON: Brief explanation in one sentence"""
-
-        user_prompt = f"""Original Song:
-Title: {original_metadata.title}
-Artist: {original_metadata.artist}
-Album: {original_metadata.album or "Unknown"}
-
-Spotify Candidates:
-{candidates_text}
-
-Which is the best match?"""
+        user_prompt = "".join(
+            (
+                _USER_PROMPT_PREFIX,
+                original_metadata.title,
+                "\nArtist: ",
+                original_metadata.artist,
+                "\nAlbum: ",
+                original_metadata.album or "Unknown",
+                _USER_PROMPT_MID,
+                candidates_text,
+                _USER_PROMPT_SUFFIX,
+            )
+        )
 
-        # Initialize Claude client
-        client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        # Reuse the shared Claude client
+        client = _get_anthropic_client(settings.anthropic_api_key)
 
-        activity.logger.info(f"Invoking Claude with model: {settings.claude_model}")
+        activity.logger.info(f"Invoking Claude with model: {model}")
 
-        # Call Claude API
+        # Call Claude API, forcing the answer through the select_match tool
         response = await client.messages.create(
-            model=settings.claude_model,
-            max_tokens=1024,
+            model=model,
+            max_tokens=MAX_RESPONSE_TOKENS,
             temperature=0,  # Deterministic for consistency
-            system=system_prompt,
+            system=_cached_system(SYSTEM_PROMPT),
+            tools=[_CLAUDE_MATCH_TOOL],
+            tool_choice={"type": "tool", "name": _CLAUDE_MATCH_TOOL["name"]},
             messages=[{"role": "user", "content": user_prompt}],
         )
+        tool_input = next(
+            (block.input for block in response.content if block.type == "tool_use"), None
+        )
 
         # Parse response
-        content = response.content[0].text
-        activity.logger.debug(f"Claude response: {content}")
+        activity.logger.debug(f"Claude response: {tool_input}")
 
         # Extract URI and reason
         try:
-            lines = content.strip().split("\n")
-            uri_line = next((l for l in lines if l.startswith("URI:")), None)
-            reason_line = next((l for l in lines if l.startswith("REASON:")), None)
-
-            if not uri_line or not reason_line:
-                raise ValueError("Claude response missing URI or REASON")
-
-            selected_uri = uri_line.replace("URI:", "").strip()
-            reasoning = reason_line.replace("REASON:", "").strip()
+            selected_uri, reasoning = _parse_response(tool_input, "Claude")
 
             # Check if Claude said no match
             if selected_uri.upper() == "NONE":
@@ -371,9 +788,7 @@ Which is the best match?"""
                 }
 
             # Find matching candidate
-            matched_track = next(
-                (c for c in candidates if c.spotify_uri == selected_uri), None
-            )
+            matched_track = by_uri.get(selected_uri)
 
             if matched_track:
                 activity.logger.info(f"Claude selected: {matched_track.track_name} - {reasoning}")
@@ -395,7 +810,7 @@ Which is the best match?"""
                     "reasoning": f"Claude returned invalid URI: {selected_uri}",
                 }
 
-        except (ValueError, StopIteration) as e:
+        except ValueError as e:
             activity.logger.error(f"Failed to parse Claude response: {e}")
             return {
                 "is_match": False,
@@ -424,3 +839,10 @@ Which is the best match?"""
             non_retryable=False,
             type="AIDisambiguationError",
         )
+
+
+# Provider name -> single-song disambiguation function
+_PROVIDERS = {
+    "langchain": _ai_disambiguate_with_langchain,
+    "claude": _ai_disambiguate_with_claude,
+}
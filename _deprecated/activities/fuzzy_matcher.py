@@ -1,18 +1,69 @@
 """Fuzzy matching activity for finding the best Spotify track match."""
 
+import asyncio
 from typing import List, Dict, Optional
 
+import numpy as np
+from numpy.typing import NDArray
 from temporalio import activity
-from rapidfuzz import fuzz
-
+from rapidfuzz import fuzz, utils
+
+from activities.scoring import (
+    SCORE_WEIGHTS,
+    SCORE_WEIGHTS_NO_ALBUM,
+    combine_scores,
+    similarity_scores,
+)
 from models.data_models import SongMetadata, SpotifyTrackResult, FuzzyMatchScore
 
 
+def _index_by_isrc(
+    search_results: List[SpotifyTrackResult],
+) -> Dict[str, List[SpotifyTrackResult]]:
+    """Group search results by ISRC in a single pass.
+
+    Results without an ISRC are left out. Results that share an ISRC keep
+    their search order.
+
+    Args:
+        search_results: List of Spotify search results
+
+    Returns:
+        Dictionary mapping ISRC to the results carrying it
+    """
+    by_isrc: Dict[str, List[SpotifyTrackResult]] = {}
+    for result in search_results:
+        if result.isrc:
+            by_isrc.setdefault(result.isrc, []).append(result)
+    return by_isrc
+
+
+def _top_k_indices(scores: NDArray[np.float64], k: int) -> NDArray[np.intp]:
+    """Indices of the k highest scores, best first.
+
+    Selects the top k with a single partition pass and only sorts those,
+    rather than sorting every score. Ties keep their original order.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of indices to return
+
+    Returns:
+        Array of at most k indices into scores
+    """
+    if k < len(scores):
+        top = np.sort(np.argpartition(-scores, k - 1)[:k])
+    else:
+        top = np.arange(len(scores))
+    return top[np.argsort(-scores[top], kind="stable")]
+
+
 @activity.defn(name="fuzzy-match")
 async def fuzzy_match_tracks(
     original_metadata: SongMetadata,
     search_results: List[SpotifyTrackResult],
     threshold: float,
+    top_k: Optional[int] = 10,
 ) -> Dict:
     """Fuzzy string matching to find best track match.
 
@@ -20,6 +71,7 @@ async def fuzzy_match_tracks(
         original_metadata: Original song from Apple Music
         search_results: List of Spotify search results
         threshold: Minimum confidence score (0.0-1.0)
+        top_k: Maximum number of entries in all_scores (None for all)
 
     Returns:
         Dictionary with match result containing:
@@ -27,8 +79,23 @@ async def fuzzy_match_tracks(
         - confidence: float
         - matched_track: SpotifyTrackResult or None
         - match_method: str
-        - all_scores: List of FuzzyMatchScore
+        - all_scores: Score dicts for the top_k candidates, best first, keyed
+          to search_results by track_id
     """
+    # Scoring is CPU-bound, so run it off the event loop to keep other
+    # activities on this worker responsive
+    return await asyncio.to_thread(
+        _fuzzy_match_tracks_sync, original_metadata, search_results, threshold, top_k
+    )
+
+
+def _fuzzy_match_tracks_sync(
+    original_metadata: SongMetadata,
+    search_results: List[SpotifyTrackResult],
+    threshold: float,
+    top_k: Optional[int],
+) -> Dict:
+    """Blocking implementation of fuzzy_match_tracks."""
     activity.logger.info(f"Fuzzy matching {len(search_results)} candidates for: {original_metadata}")
 
     if not search_results:
@@ -41,59 +108,74 @@ async def fuzzy_match_tracks(
             "all_scores": [],
         }
 
-    best_match = None
-    best_score = 0.0
-    all_scores = []
-
-    for result in search_results:
-        # Calculate individual component scores
-        title_score = (
-            fuzz.ratio(original_metadata.title.lower(), result.track_name.lower()) / 100.0
+    # An ISRC exact match identifies the recording outright, so only those
+    # candidates need scoring
+    isrc_hits = []
+    if original_metadata.isrc:
+        isrc_hits = _index_by_isrc(search_results).get(original_metadata.isrc, [])
+    candidates = isrc_hits or search_results
+
+    if isrc_hits:
+        activity.logger.info(
+            f"ISRC match found, skipping fuzzy scoring of "
+            f"{len(search_results) - len(isrc_hits)} other candidates"
         )
 
-        artist_score = (
-            fuzz.ratio(original_metadata.artist.lower(), result.artist_name.lower()) / 100.0
-        )
+    # Lowercase each query once rather than per comparison
+    q_title = original_metadata.title.lower()
+    q_artist = original_metadata.artist.lower()
+    q_album = (original_metadata.album or "").lower()
+
+    weights = SCORE_WEIGHTS if q_album else SCORE_WEIGHTS_NO_ALBUM
+
+    # Score every candidate per component in one batched rapidfuzz call each.
+    # WRatio tolerates reordered words and punctuation ("Artist, The" vs
+    # "The Artist", "Song - Remastered") in titles and artists.
+    title_scores = similarity_scores(
+        q_title,
+        [r.track_name_lc for r in candidates],
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+    )
+    artist_scores = similarity_scores(
+        q_artist,
+        [r.artist_name_lc for r in candidates],
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+    )
 
-        album_score = 0.0
-        if original_metadata.album and result.album_name:
-            album_score = (
-                fuzz.ratio(original_metadata.album.lower(), result.album_name.lower()) / 100.0
-            )
-
-        # Check for ISRC exact match (highest priority)
-        isrc_match = False
-        if original_metadata.isrc and result.isrc:
-            if original_metadata.isrc == result.isrc:
-                isrc_match = True
-                # ISRC match is perfect
-                combined_score = 1.0
-            else:
-                # ISRCs exist but don't match - calculate weighted score
-                combined_score = title_score * 0.5 + artist_score * 0.35 + album_score * 0.15
-        else:
-            # No ISRC available - use weighted combination
-            # Title is most important (50%), then artist (35%), then album (15%)
-            combined_score = title_score * 0.5 + artist_score * 0.35 + album_score * 0.15
-
-        # Store score details
-        score_info = FuzzyMatchScore(
-            track=result,
-            combined_score=combined_score,
-            title_score=title_score,
-            artist_score=artist_score,
-            album_score=album_score,
-            isrc_match=isrc_match,
+    album_scores = np.zeros(len(candidates))
+    if q_album:
+        # Missing candidate albums score 0.0 against a non-empty query
+        album_scores = similarity_scores(
+            q_album, [r.album_name_lc for r in candidates]
         )
-        all_scores.append(score_info)
 
-        # Track best match
-        if combined_score > best_score:
-            best_score = combined_score
-            best_match = result
+    combined_scores, best_idx, best_score = combine_scores(
+        title_scores,
+        artist_scores,
+        album_scores,
+        np.full(len(candidates), bool(isrc_hits)),
+        weights,
+    )
+    best_match = candidates[best_idx]
 
-    # Sort scores by combined_score descending
-    all_scores.sort(key=lambda x: x.combined_score, reverse=True)
+    # Only the top_k candidates are ranked and returned, keeping the activity
+    # result (stored in workflow history) small
+    ranking = _top_k_indices(
+        combined_scores, len(candidates) if top_k is None else top_k
+    )
+    all_scores = [
+        FuzzyMatchScore(
+            track=candidates[idx],
+            combined_score=float(combined_scores[idx]),
+            title_score=float(title_scores[idx]),
+            artist_score=float(artist_scores[idx]),
+            album_score=float(album_scores[idx]),
+            isrc_match=bool(isrc_hits),
+        )
+        for idx in ranking
+    ]
 
     # Determine if we have a match above threshold
     is_match = best_score >= threshold
@@ -101,10 +183,7 @@ async def fuzzy_match_tracks(
     # Determine match method
     match_method = "none"
     if is_match:
-        if any(score.isrc_match for score in all_scores[:1]):  # Check best match
-            match_method = "isrc"
-        else:
-            match_method = "fuzzy"
+        match_method = "isrc" if isrc_hits else "fuzzy"
 
     activity.logger.info(
         f"Best match: {best_match.track_name if best_match else 'None'} "
@@ -112,13 +191,14 @@ async def fuzzy_match_tracks(
     )
 
     # Log top 3 candidates for debugging
-    for idx, score in enumerate(all_scores[:3], 1):
+    for rank, idx in enumerate(_top_k_indices(combined_scores, 3), 1):
+        track = candidates[idx]
         activity.logger.debug(
-            f"  #{idx}: {score.track.track_name} by {score.track.artist_name} "
-            f"(score: {score.combined_score:.2f}, "
-            f"title: {score.title_score:.2f}, "
-            f"artist: {score.artist_score:.2f}, "
-            f"album: {score.album_score:.2f})"
+            f"  #{rank}: {track.track_name} by {track.artist_name} "
+            f"(score: {combined_scores[idx]:.2f}, "
+            f"title: {title_scores[idx]:.2f}, "
+            f"artist: {artist_scores[idx]:.2f}, "
+            f"album: {album_scores[idx]:.2f})"
         )
 
     return {
@@ -128,13 +208,7 @@ async def fuzzy_match_tracks(
         "match_method": match_method,
         "all_scores": [
             {
-                "track": {
-                    "track_id": score.track.track_id,
-                    "track_name": score.track.track_name,
-                    "artist_name": score.track.artist_name,
-                    "album_name": score.track.album_name,
-                    "spotify_uri": score.track.spotify_uri,
-                },
+                "track_id": score.track.track_id,
                 "score": score.combined_score,
                 "title_score": score.title_score,
                 "artist_score": score.artist_score,
@@ -1,8 +1,9 @@
 """Playlist management activities for adding and verifying tracks."""
 
-from typing import Dict
+from typing import Dict, List
 
 from temporalio import activity
+from temporalio.exceptions import ApplicationError
 
 from mcp_client.client import get_spotify_mcp_client
 
@@ -39,34 +40,103 @@ async def add_track_to_playlist(track_uri: str, playlist_id: str, user_id: str)
 
         return {"status": "added", "track_uri": track_uri, "snapshot_id": result.get("snapshot_id")}
 
-    except ValueError as e:
-        # MCP tool returned an error
-        error_msg = str(e).lower()
-
-        # Classify errors for retry behavior
-        if "not found" in error_msg:
-            activity.logger.error(f"Playlist not found: {playlist_id}")
-            raise activity.ApplicationError(
-                "Playlist not found", non_retryable=True, type="PlaylistNotFoundError"
-            )
-
-        elif "insufficient" in error_msg or "scope" in error_msg:
-            activity.logger.error("Insufficient OAuth scopes")
-            raise activity.ApplicationError(
-                "Insufficient OAuth scopes for playlist modification",
-                non_retryable=True,
-                type="InsufficientScopeError",
-            )
+    except Exception as e:
+        raise _classify_playlist_error(e, playlist_id, "Failed to add track")
 
-        else:
-            # Other MCP errors are retryable
-            activity.logger.error(f"MCP error: {e}")
-            raise activity.ApplicationError(f"MCP error: {str(e)}", non_retryable=False)
+
+@activity.defn(name="add-tracks-batch")
+async def add_tracks_to_playlist(track_uris: List[str], playlist_id: str, user_id: str) -> Dict:
+    """Add several tracks to a Spotify playlist (idempotent).
+
+    Reads the playlist contents once and adds every missing track in bulk,
+    instead of a verify and add round-trip per track.
+
+    Args:
+        track_uris: Spotify track URIs (spotify:track:xxxxx)
+        playlist_id: Spotify playlist ID
+        user_id: User identifier for logging
+
+    Returns:
+        Dictionary with added and already-present track URIs
+    """
+    activity.logger.info(
+        f"Adding {len(track_uris)} tracks to playlist {playlist_id} for user {user_id}"
+    )
+
+    if not track_uris:
+        return {"status": "already_exists", "added": [], "already_exists": []}
+
+    try:
+        # Get MCP client
+        mcp_client = await get_spotify_mcp_client()
+
+        # Fetch the current playlist once (idempotency)
+        existing = set(await mcp_client.list_playlist_tracks(playlist_id))
+        to_add = list(dict.fromkeys(uri for uri in track_uris if uri not in existing))
+        already_exists = [uri for uri in track_uris if uri in existing]
+
+        if not to_add:
+            activity.logger.info("All tracks already in playlist, skipping (idempotent)")
+            return {"status": "already_exists", "added": [], "already_exists": already_exists}
+
+        result = await mcp_client.add_tracks_to_playlist(to_add, playlist_id)
+
+        activity.logger.info(
+            f"Successfully added {len(to_add)} tracks "
+            f"({len(already_exists)} already present): {result.get('snapshot_id', 'N/A')}"
+        )
+
+        return {
+            "status": "added",
+            "added": to_add,
+            "already_exists": already_exists,
+            "snapshot_id": result.get("snapshot_id"),
+        }
 
     except Exception as e:
+        raise _classify_playlist_error(e, playlist_id, "Failed to add tracks")
+
+
+def _classify_playlist_error(
+    error: Exception, playlist_id: str, failure_message: str
+) -> Exception:
+    """Map a playlist write failure to an ApplicationError with retry semantics.
+
+    Args:
+        error: Exception raised while modifying the playlist
+        playlist_id: Spotify playlist ID, for logging
+        failure_message: Message prefix for unexpected errors
+
+    Returns:
+        ApplicationError to raise from the activity
+    """
+    if not isinstance(error, ValueError):
         # Unexpected errors are retryable
-        activity.logger.error(f"Failed to add track: {e}")
-        raise activity.ApplicationError(f"Failed to add track: {str(e)}", non_retryable=False)
+        activity.logger.error(f"{failure_message}: {error}")
+        return ApplicationError(f"{failure_message}: {str(error)}", non_retryable=False)
+
+    # MCP tool returned an error
+    error_msg = str(error).lower()
+
+    # Classify errors for retry behavior
+    if "not found" in error_msg:
+        activity.logger.error(f"Playlist not found: {playlist_id}")
+        return ApplicationError(
+            "Playlist not found", non_retryable=True, type="PlaylistNotFoundError"
+        )
+
+    elif "insufficient" in error_msg or "scope" in error_msg:
+        activity.logger.error("Insufficient OAuth scopes")
+        return ApplicationError(
+            "Insufficient OAuth scopes for playlist modification",
+            non_retryable=True,
+            type="InsufficientScopeError",
+        )
+
+    else:
+        # Other MCP errors are retryable
+        activity.logger.error(f"MCP error: {error}")
+        return ApplicationError(f"MCP error: {str(error)}", non_retryable=False)
 
 
 @activity.defn(name="verify-track-added")
@@ -0,0 +1,93 @@
+"""Fuzzy scoring helpers shared by the Temporal activity and the standalone executor.
+
+Kept free of Temporal imports so the standalone executor can use them
+without temporalio installed, and so a song scores identically in both
+modes.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from rapidfuzz import fuzz, process
+
+# Title is most important (50%), then artist (35%), then album (15%)
+SCORE_WEIGHTS = (0.5, 0.35, 0.15)
+# Without a query album its share goes to title and artist instead of
+# capping every candidate at 0.85
+SCORE_WEIGHTS_NO_ALBUM = (0.6, 0.4, 0.0)
+# Below this many candidates, thread start-up outweighs parallel scoring
+PARALLEL_SCORING_MIN_CANDIDATES = 50
+
+
+def similarity_scores(
+    query: str,
+    choices: List[str],
+    scorer: Callable = fuzz.ratio,
+    processor: Optional[Callable] = None,
+) -> NDArray[np.float64]:
+    """Score one query against every choice in a single batched call.
+
+    Inputs are compared as-is unless a processor is given; callers lowercase
+    them beforehand. Each distinct choice is scored once (search results
+    often repeat the same artist or album). Choices identical to the query
+    score 1.0 and empty choices 0.0 without a rapidfuzz call. Large batches
+    are scored on all cores, with rapidfuzz releasing the GIL.
+
+    Args:
+        query: Lowercased string to compare against
+        choices: Lowercased candidate strings
+        scorer: rapidfuzz scorer
+        processor: Optional rapidfuzz preprocessing applied to every string
+
+    Returns:
+        1-D array of similarity scores (0.0-1.0), one per choice
+    """
+    known = {query: 1.0, "": 0.0} if query else {}
+    to_score = [c for c in dict.fromkeys(choices) if c not in known]
+
+    if to_score:
+        scores = process.cdist(
+            [query],
+            to_score,
+            scorer=scorer,
+            processor=processor,
+            dtype=np.float64,
+            workers=-1 if len(to_score) >= PARALLEL_SCORING_MIN_CANDIDATES else 1,
+        )[0]
+        known.update(zip(to_score, (scores / 100.0).tolist()))
+
+    return np.array([known[c] for c in choices], dtype=np.float64)
+
+
+def combine_scores(
+    title: NDArray[np.float64],
+    artist: NDArray[np.float64],
+    album: NDArray[np.float64],
+    isrc_match: NDArray[np.bool_],
+    weights: Tuple[float, float, float] = SCORE_WEIGHTS,
+) -> Tuple[NDArray[np.float64], int, float]:
+    """Weight component scores into combined scores and find the best one.
+
+    Candidates with an ISRC match score a perfect 1.0. Accumulates in place
+    through one scratch buffer rather than a temporary per operation.
+
+    Args:
+        title: Title scores (0.0-1.0)
+        artist: Artist scores (0.0-1.0)
+        album: Album scores (0.0-1.0)
+        isrc_match: Boolean mask of candidates whose ISRC matches
+        weights: (title, artist, album) weights summing to 1.0
+
+    Returns:
+        Tuple of (combined scores, index of the best candidate, best score)
+    """
+    w_title, w_artist, w_album = weights
+    combined = np.multiply(title, w_title)
+    scratch = np.multiply(artist, w_artist)
+    combined += scratch
+    if w_album:
+        combined += np.multiply(album, w_album, out=scratch)
+    combined[isrc_match] = 1.0
+    best_idx = int(np.argmax(combined))
+    return combined, best_idx, float(combined[best_idx])
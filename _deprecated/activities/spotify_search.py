@@ -37,21 +37,20 @@ async def search_spotify(metadata: SongMetadata) -> List[SpotifyTrackResult]:
         results = await mcp_client.search_track(search_query, limit=10)
 
         # Parse MCP response
-        tracks = []
-        for item in results.get("tracks", []):
-            tracks.append(
-                SpotifyTrackResult(
-                    track_id=item["id"],
-                    track_name=item["name"],
-                    artist_name=item["artist"],
-                    album_name=item["album"],
-                    spotify_uri=item["uri"],
-                    duration_ms=item["duration_ms"],
-                    popularity=item["popularity"],
-                    release_date=item["release_date"],
-                    isrc=item.get("isrc"),
-                )
+        tracks = [
+            SpotifyTrackResult(
+                track_id=item["id"],
+                track_name=item["name"],
+                artist_name=item["artist"],
+                album_name=item["album"],
+                spotify_uri=item["uri"],
+                duration_ms=item["duration_ms"],
+                popularity=item["popularity"],
+                release_date=item["release_date"],
+                isrc=item.get("isrc"),
             )
+            for item in results.get("tracks", ())
+        ]
 
         activity.logger.info(f"Found {len(tracks)} candidates")
 
@@ -64,7 +63,7 @@ async def search_spotify(metadata: SongMetadata) -> List[SpotifyTrackResult]:
         # Handle rate limiting
         if e.response.status_code == 429:
             retry_after = int(e.response.headers.get("Retry-After", 60))
-            activity.logger.warning(f"Rate limited, retry after {retry_after}s")
+            activity.logger.warning("Rate limited, retry after %ss", retry_after)
 
             raise activity.ApplicationError(
                 f"Spotify rate limit exceeded, retry after {retry_after}s",
@@ -73,7 +72,7 @@ async def search_spotify(metadata: SongMetadata) -> List[SpotifyTrackResult]:
             )
 
         # Other HTTP errors
-        activity.logger.error(f"HTTP error during search: {e}")
+        activity.logger.error("HTTP error during search: %s", e)
         raise activity.ApplicationError(
             f"Spotify API error: {e.response.status_code}",
             non_retryable=False,
@@ -81,7 +80,7 @@ async def search_spotify(metadata: SongMetadata) -> List[SpotifyTrackResult]:
 
     except ValueError as e:
         # MCP tool returned an error
-        activity.logger.error(f"MCP error: {e}")
+        activity.logger.error("MCP error: %s", e)
         raise activity.ApplicationError(
             f"MCP tool error: {str(e)}",
             non_retryable=True,
@@ -90,7 +89,7 @@ async def search_spotify(metadata: SongMetadata) -> List[SpotifyTrackResult]:
 
     except Exception as e:
         # Unexpected errors
-        activity.logger.error(f"Unexpected error during search: {e}")
+        activity.logger.error("Unexpected error during search: %s", e)
         raise activity.ApplicationError(
             f"Search failed: {str(e)}",
             non_retryable=False,
@@ -9,10 +9,14 @@ from executors.standalone_executor import (
     run_standalone_workflow,
     get_workflow_progress,
     get_workflow_state,
+    mark_workflow_queued,
+    workflow_progress,
 )
 
 __all__ = [
     "run_standalone_workflow",
     "get_workflow_progress",
     "get_workflow_state",
+    "mark_workflow_queued",
+    "workflow_progress",
 ]
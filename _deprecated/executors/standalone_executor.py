@@ -64,10 +64,17 @@ IMPLEMENTATION NOTES:
 
 import asyncio
 import logging
+import random
+import re
 import time
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Type
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
 
 from models.data_models import (
     SongMetadata,
@@ -76,93 +83,219 @@ from models.data_models import (
     WorkflowResult,
     WorkflowProgress,
 )
-from mcp_client.client import get_spotify_mcp_client
-from rapidfuzz import fuzz
+from activities.scoring import (
+    SCORE_WEIGHTS,
+    SCORE_WEIGHTS_NO_ALBUM,
+    combine_scores,
+    similarity_scores,
+)
+from mcp_client.client import TransientToolError, get_spotify_mcp_client
+from rapidfuzz import fuzz, utils
 from config.settings import settings
+from utils.ttl_cache import TTLCache
 
 # Import AI disambiguation logic
+import anthropic
+import httpx
+import openai
 from anthropic import AsyncAnthropic
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
 logger = logging.getLogger(__name__)
 
+# Transient failures worth retrying. Other MCP tool errors (playlist not
+# found, missing scope, bad URI) surface as plain ValueError and fail fast.
+MCP_RETRYABLE_ERRORS = (TransientToolError, ConnectionError, TimeoutError, OSError)
+AI_RETRYABLE_ERRORS = (
+    anthropic.APIError,
+    openai.APIError,
+    httpx.HTTPError,
+    ConnectionError,
+    TimeoutError,
+)
 
 # In-memory storage for workflow status
 # In production, this could be Redis or a database
-# For now, we keep it simple with a dict
-workflow_status_store: Dict[str, Dict] = {}
+# For now, we keep it simple with an insertion-ordered dict, bounded in size
+# and pruned of finished workflows once they age out
+workflow_status_store: "OrderedDict[str, StandaloneWorkflowState]" = OrderedDict()
+MAX_STORED_WORKFLOWS = 10_000
+FINISHED_WORKFLOW_TTL_SECONDS = 600
+
+# Finished workflow IDs mapped to their time.monotonic() completion time, in
+# completion order; only these are ever pruned or evicted
+_finished_workflows: "OrderedDict[str, float]" = OrderedDict()
 
 
-@dataclass
+@dataclass(slots=True)
 class StandaloneWorkflowState:
     """State tracking for standalone workflow execution."""
 
     workflow_id: str
     current_step: str
     candidates_found: int
-    start_time: float
-    status: str  # running, completed, failed
+    started_at: datetime  # wall-clock start, for display
+    started_monotonic: float  # time.monotonic() at start, for durations
+    status: str  # queued, running, completed, failed
     result: Optional[WorkflowResult] = None
     error: Optional[str] = None
 
 
+def _store_workflow_state(state: "StandaloneWorkflowState") -> None:
+    """Track a new workflow, evicting stale entries to keep the store bounded.
+
+    Finished workflows are kept for FINISHED_WORKFLOW_TTL_SECONDS after they
+    complete, so a client polling a long-running workflow can still read its
+    result. Past MAX_STORED_WORKFLOWS, the longest-finished entries are
+    evicted early; queued and running workflows are never dropped.
+    """
+    # Re-insert rather than overwrite so a queued workflow moves to its start position
+    workflow_status_store.pop(state.workflow_id, None)
+    _finished_workflows.pop(state.workflow_id, None)
+    workflow_status_store[state.workflow_id] = state
+
+    cutoff = time.monotonic() - FINISHED_WORKFLOW_TTL_SECONDS
+    while _finished_workflows:
+        workflow_id, finished = next(iter(_finished_workflows.items()))
+        if finished > cutoff and len(workflow_status_store) <= MAX_STORED_WORKFLOWS:
+            break
+        del _finished_workflows[workflow_id]
+        workflow_status_store.pop(workflow_id, None)
+
+
+def _finish_workflow_state(state: "StandaloneWorkflowState", status: str) -> None:
+    """Mark a workflow completed or failed and start its retention TTL."""
+    state.status = status
+    _finished_workflows[state.workflow_id] = time.monotonic()
+
+
 async def execute_with_retry(
-    func, *args, max_attempts: int = 3, initial_delay: float = 1.0, backoff: float = 2.0, **kwargs
+    func,
+    *args,
+    max_attempts: int = 3,
+    initial_delay: float = 1.0,
+    backoff: float = 2.0,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+    **kwargs,
 ):
     """
     Execute an async function with exponential backoff retry logic.
 
     This mimics Temporal's retry policy but in a simpler, standalone way.
+    Delays are jittered so concurrent workflows failing together do not
+    retry in lockstep.
 
     Args:
         func: Async function to execute
         max_attempts: Maximum number of retry attempts
         initial_delay: Initial delay in seconds before first retry
         backoff: Backoff multiplier for exponential backoff
+        retry_on: Exception types worth retrying; anything else is raised
+            immediately
         *args, **kwargs: Arguments to pass to the function
 
     Returns:
         Function result
 
     Raises:
-        Last exception if all retries fail
+        Last exception if all retries fail, or the first non-retryable one
     """
     last_exception = None
-    delay = initial_delay
 
     for attempt in range(1, max_attempts + 1):
         try:
             return await func(*args, **kwargs)
         except Exception as e:
+            if not isinstance(e, retry_on):
+                logger.error("Non-retryable error: %.100s", e)
+                raise
+
             last_exception = e
             logger.warning(
-                f"Attempt {attempt}/{max_attempts} failed: {str(e)[:100]}",
+                "Attempt %d/%d failed: %.100s",
+                attempt,
+                max_attempts,
+                e,
                 exc_info=attempt == max_attempts,  # Full traceback on last attempt
             )
 
             if attempt < max_attempts:
-                logger.info(f"Retrying in {delay:.1f}s...")
+                delay = initial_delay * backoff ** (attempt - 1) * random.uniform(0.5, 1.5)
+                logger.info("Retrying in %.1fs...", delay)
                 await asyncio.sleep(delay)
-                delay *= backoff
             else:
-                logger.error(f"All {max_attempts} attempts failed")
+                logger.error("All %d attempts failed", max_attempts)
 
     raise last_exception
 
 
+# Recent search results keyed by search query, so workflows syncing the same
+# song (e.g. a shared playlist) reuse one Spotify search. Concurrent callers
+# for a query already being fetched await the same future. Empty results are
+# not cached, so a song that is not on Spotify yet is searched afresh.
+SEARCH_CACHE_TTL_SECONDS = 300
+SEARCH_CACHE_MAX_ENTRIES = 1024
+_search_cache: "TTLCache[str, List[SpotifyTrackResult]]" = TTLCache(
+    SEARCH_CACHE_TTL_SECONDS, SEARCH_CACHE_MAX_ENTRIES
+)
+_search_inflight: "Dict[str, asyncio.Future[List[SpotifyTrackResult]]]" = {}
+
+
 async def search_spotify_standalone(metadata: SongMetadata) -> List[SpotifyTrackResult]:
     """
     Search Spotify catalog (standalone version without Temporal).
 
     This function replicates the logic from activities/spotify_search.py
     but without Temporal activity decorators.
+
+    Non-empty results are cached per search query for SEARCH_CACHE_TTL_SECONDS,
+    and identical searches issued while one is in flight share its result.
     """
-    logger.info(f"Searching Spotify for: {metadata}")
+    search_query = metadata.to_search_query()
+
+    cached = _search_cache.get(search_query)
+    if cached is not None:
+        logger.info("Search cache hit for: %s", search_query)
+        return list(cached)
+
+    inflight = _search_inflight.get(search_query)
+    if inflight is not None:
+        logger.info("Joining in-flight search for: %s", search_query)
+        return list(await asyncio.shield(inflight))
+
+    future: "asyncio.Future[List[SpotifyTrackResult]]" = (
+        asyncio.get_running_loop().create_future()
+    )
+    _search_inflight[search_query] = future
+    try:
+        tracks = await _fetch_spotify_tracks(metadata, search_query)
+    except BaseException as e:
+        # Waiters should see a retryable failure even if this task was
+        # cancelled, rather than being cancelled along with it
+        if isinstance(e, Exception):
+            future.set_exception(e)
+        else:
+            future.set_exception(ConnectionError(f"Search for {search_query!r} was cancelled"))
+        future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    else:
+        future.set_result(tracks)
+        if tracks:
+            _search_cache.set(search_query, tracks)
+        return list(tracks)
+    finally:
+        del _search_inflight[search_query]
+
+
+async def _fetch_spotify_tracks(
+    metadata: SongMetadata, search_query: str
+) -> List[SpotifyTrackResult]:
+    """Run one Spotify search through MCP and convert the results."""
+    logger.info("Searching Spotify for: %s", metadata)
 
     mcp_client = await get_spotify_mcp_client()
-    search_query = metadata.to_search_query()
-    logger.info(f"Search query: {search_query}")
+    logger.info("Search query: %s", search_query)
 
     results = await mcp_client.search_track(search_query, limit=10)
 
@@ -182,7 +315,7 @@ async def search_spotify_standalone(metadata: SongMetadata) -> List[SpotifyTrack
             )
         )
 
-    logger.info(f"Found {len(tracks)} candidates")
+    logger.info("Found %d candidates", len(tracks))
     return tracks
 
 
@@ -193,9 +326,11 @@ async def fuzzy_match_standalone(
     Fuzzy string matching (standalone version without Temporal).
 
     This function replicates the logic from activities/fuzzy_matcher.py
-    but without Temporal activity decorators.
+    but without Temporal activity decorators. Per-candidate scores are
+    returned as parallel arrays aligned with search_results, plus an
+    "order" permutation ranking them best first.
     """
-    logger.info(f"Fuzzy matching {len(search_results)} candidates")
+    logger.info("Fuzzy matching %d candidates", len(search_results))
 
     if not search_results:
         return {
@@ -203,73 +338,93 @@ async def fuzzy_match_standalone(
             "confidence": 0.0,
             "matched_track": None,
             "match_method": "none",
-            "all_scores": [],
+            "scores": np.zeros(0),
+            "order": np.zeros(0, dtype=np.intp),
         }
 
-    best_match = None
-    best_score = 0.0
-    all_scores = []
-
-    for result in search_results:
-        # Calculate component scores (same logic as Temporal version)
-        title_score = fuzz.ratio(original_metadata.title.lower(), result.track_name.lower()) / 100.0
-        artist_score = (
-            fuzz.ratio(original_metadata.artist.lower(), result.artist_name.lower()) / 100.0
-        )
+    # Lowercase each query once; candidates cache their own lowercased names
+    q_title = original_metadata.title.lower()
+    q_artist = original_metadata.artist.lower()
+    q_album = (original_metadata.album or "").lower()
+
+    # Score every candidate per component in one batched rapidfuzz call each.
+    # WRatio tolerates reordered words and punctuation in titles and artists.
+    title_scores = similarity_scores(
+        q_title,
+        [r.track_name_lc for r in search_results],
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+    )
+    artist_scores = similarity_scores(
+        q_artist,
+        [r.artist_name_lc for r in search_results],
+        scorer=fuzz.WRatio,
+        processor=utils.default_process,
+    )
 
-        album_score = 0.0
-        if original_metadata.album and result.album_name:
-            album_score = (
-                fuzz.ratio(original_metadata.album.lower(), result.album_name.lower()) / 100.0
-            )
+    album_scores = np.zeros(len(search_results))
+    if q_album:
+        album_scores = similarity_scores(q_album, [r.album_name_lc for r in search_results])
 
-        # Check for ISRC exact match
-        isrc_match = False
-        if original_metadata.isrc and result.isrc and original_metadata.isrc == result.isrc:
-            isrc_match = True
-            combined_score = 1.0
-        else:
-            # Weighted combination: title 50%, artist 35%, album 15%
-            combined_score = title_score * 0.5 + artist_score * 0.35 + album_score * 0.15
-
-        all_scores.append(
-            {
-                "track": result,
-                "score": combined_score,
-                "title_score": title_score,
-                "artist_score": artist_score,
-                "album_score": album_score,
-                "isrc_match": isrc_match,
-            }
-        )
+    # Check for ISRC exact match
+    isrc_mask = np.array(
+        [bool(original_metadata.isrc) and original_metadata.isrc == r.isrc for r in search_results]
+    )
 
-        if combined_score > best_score:
-            best_score = combined_score
-            best_match = result
+    combined_scores, best_idx, best_score = combine_scores(
+        title_scores,
+        artist_scores,
+        album_scores,
+        isrc_mask,
+        SCORE_WEIGHTS if q_album else SCORE_WEIGHTS_NO_ALBUM,
+    )
+    best_match = search_results[best_idx]
 
-    # Sort by score descending
-    all_scores.sort(key=lambda x: x["score"], reverse=True)
+    # Rank by score descending (stable, so ties keep search order)
+    order = np.argsort(-combined_scores, kind="stable")
 
     is_match = best_score >= threshold
 
     # Determine match method
     match_method = "none"
     if is_match:
-        match_method = "isrc" if all_scores[0]["isrc_match"] else "fuzzy"
+        match_method = "isrc" if isrc_mask[best_idx] else "fuzzy"
 
-    logger.info(f"Best match score: {best_score:.2f}, threshold: {threshold}, method: {match_method}")
+    logger.info(
+        "Best match score: %.2f, threshold: %s, method: %s", best_score, threshold, match_method
+    )
 
     return {
         "is_match": is_match,
         "confidence": best_score,
         "matched_track": best_match if is_match else None,
         "match_method": match_method,
-        "all_scores": all_scores,
+        "scores": combined_scores,
+        "title_scores": title_scores,
+        "artist_scores": artist_scores,
+        "album_scores": album_scores,
+        "isrc_mask": isrc_mask,
+        "order": order,
     }
 
 
+def _format_candidates(candidates: List[SpotifyTrackResult], fuzzy_scores: List[float]) -> str:
+    """Format candidates and their fuzzy scores for an AI prompt."""
+    return "".join(
+        f"""
+{idx}. "{candidate.track_name}" by {candidate.artist_name}
+   Album: {candidate.album_name}
+   Release Date: {candidate.release_date}
+   Fuzzy Match Score: {fuzzy_score:.2f}
+   Popularity: {candidate.popularity}
+   URI: {candidate.spotify_uri}
+"""
+        for idx, (candidate, fuzzy_score) in enumerate(zip(candidates, fuzzy_scores), 1)
+    )
+
+
 async def ai_disambiguate_standalone(
-    original_metadata: SongMetadata, candidates: List[SpotifyTrackResult], fuzzy_scores: List[Dict]
+    original_metadata: SongMetadata, candidates: List[SpotifyTrackResult], fuzzy_scores: List[float]
 ) -> Dict:
     """
     AI-powered disambiguation (standalone version).
@@ -277,7 +432,9 @@ async def ai_disambiguate_standalone(
     This function replicates the logic from activities/ai_disambiguator.py
     but without Temporal activity decorators. Supports both Claude and Langchain.
     """
-    logger.info(f"AI disambiguating {len(candidates)} candidates using {settings.ai_provider}")
+    logger.info(
+        "AI disambiguating %d candidates using %s", len(candidates), settings.ai_provider
+    )
 
     if not candidates:
         return {
@@ -288,34 +445,20 @@ async def ai_disambiguate_standalone(
             "reasoning": "No candidates provided",
         }
 
-    # Format candidates for AI
-    candidates_text = ""
-    for idx, candidate in enumerate(candidates, 1):
-        fuzzy_info = next(
-            (s for s in fuzzy_scores if s.get("track") == candidate), {"score": 0}
-        )
-        candidates_text += f"""
-{idx}. "{candidate.track_name}" by {candidate.artist_name}
-   Album: {candidate.album_name}
-   Release Date: {candidate.release_date}
-   Fuzzy Match Score: {fuzzy_info.get('score', 0):.2f}
-   Popularity: {candidate.popularity}
-   URI: {candidate.spotify_uri}
-"""
+    candidates_text = _format_candidates(candidates, fuzzy_scores)
+    candidates_by_uri = {c.spotify_uri: c for c in candidates}
 
     if settings.ai_provider == "claude":
-        return await _ai_disambiguate_claude(original_metadata, candidates, candidates_text)
+        return await _ai_disambiguate_claude(original_metadata, candidates_by_uri, candidates_text)
     elif settings.ai_provider == "langchain":
-        return await _ai_disambiguate_langchain(original_metadata, candidates, candidates_text)
+        return await _ai_disambiguate_langchain(
+            original_metadata, candidates_by_uri, candidates_text
+        )
     else:
         raise ValueError(f"Unknown AI provider: {settings.ai_provider}")
 
 
-async def _ai_disambiguate_claude(
-    original_metadata: SongMetadata, candidates: List[SpotifyTrackResult], candidates_text: str
-) -> Dict:
-    """Claude SDK disambiguation logic."""
-    system_prompt = """You are an expert music librarian helping match songs from Apple Music to Spotify.
+SYSTEM_PROMPT = """You are an expert music librarian helping match songs from Apple Music to Spotify.
 Given an original song and multiple Spotify candidates, select the best match.
 
 Consider these factors:
@@ -333,6 +476,80 @@ Format your response EXACTLY like this:
 URI: spotify:track:xxxxx (or NONE)
 REASON: Brief explanation in one sentence"""
 
+
+def _cached_system(prompt: str) -> List[Dict]:
+    """Wrap a fixed system prompt so Anthropic caches it across calls."""
+    return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+
+_URI_RE = re.compile(r"^URI:\s*(\S+)", re.M)
+_REASON_RE = re.compile(r"^REASON:\s*(.+?)\s*$", re.M)
+
+
+def _parse_ai_response(content: str, source: str) -> Tuple[str, str]:
+    """Extract the selected URI and reasoning from a URI:/REASON: response.
+
+    Args:
+        content: Raw model response
+        source: Model name used in the error message
+
+    Returns:
+        Tuple of (selected URI or "NONE", reasoning)
+
+    Raises:
+        ValueError: If either line is missing
+    """
+    uri_match = _URI_RE.search(content)
+    reason_match = _REASON_RE.search(content)
+
+    if not uri_match or not reason_match:
+        raise ValueError(f"{source} response missing URI or REASON")
+
+    return uri_match.group(1), reason_match.group(1)
+
+
+@lru_cache(maxsize=1)
+def _get_anthropic_client() -> AsyncAnthropic:
+    """Shared Anthropic client, reusing its HTTP connection pool across calls."""
+    return AsyncAnthropic(api_key=settings.anthropic_api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_openai_llm() -> ChatOpenAI:
+    """Shared OpenAI chat model, reusing its HTTP connection pool across calls."""
+    return ChatOpenAI(model=settings.ai_model, temperature=0, api_key=settings.openai_api_key)
+
+
+@lru_cache(maxsize=1)
+def _get_openai_chain():
+    """Disambiguation prompt piped into the shared OpenAI model, built once."""
+    prompt = ChatPromptTemplate.from_messages(
+        [
+            ("system", SYSTEM_PROMPT),
+            (
+                "user",
+                """Original Song:
+Title: {title}
+Artist: {artist}
+Album: {album}
+
+Spotify Candidates:
+{candidates}
+
+Which is the best match?""",
+            ),
+        ]
+    )
+
+    return prompt | _get_openai_llm()
+
+
+async def _ai_disambiguate_claude(
+    original_metadata: SongMetadata,
+    candidates_by_uri: Dict[str, SpotifyTrackResult],
+    candidates_text: str,
+) -> Dict:
+    """Claude SDK disambiguation logic."""
     user_prompt = f"""Original Song:
 Title: {original_metadata.title}
 Artist: {original_metadata.artist}
@@ -343,30 +560,21 @@ Spotify Candidates:
 
 Which is the best match?"""
 
-    client = AsyncAnthropic(api_key=settings.anthropic_api_key)
-    logger.info(f"Invoking Claude with model: {settings.claude_model}")
+    client = _get_anthropic_client()
+    logger.info("Invoking Claude with model: %s", settings.claude_model)
 
     response = await client.messages.create(
         model=settings.claude_model,
         max_tokens=1024,
         temperature=0,
-        system=system_prompt,
+        system=_cached_system(SYSTEM_PROMPT),
         messages=[{"role": "user", "content": user_prompt}],
     )
 
     content = response.content[0].text
-    logger.debug(f"Claude response: {content}")
-
-    # Parse response
-    lines = content.strip().split("\n")
-    uri_line = next((l for l in lines if l.startswith("URI:")), None)
-    reason_line = next((l for l in lines if l.startswith("REASON:")), None)
+    logger.debug("Claude response: %s", content)
 
-    if not uri_line or not reason_line:
-        raise ValueError("Claude response missing URI or REASON")
-
-    selected_uri = uri_line.replace("URI:", "").strip()
-    reasoning = reason_line.replace("REASON:", "").strip()
+    selected_uri, reasoning = _parse_ai_response(content, "Claude")
 
     if selected_uri.upper() == "NONE":
         return {
@@ -377,10 +585,10 @@ Which is the best match?"""
             "reasoning": reasoning,
         }
 
-    matched_track = next((c for c in candidates if c.spotify_uri == selected_uri), None)
+    matched_track = candidates_by_uri.get(selected_uri)
 
     if matched_track:
-        logger.info(f"Claude selected: {matched_track.track_name} - {reasoning}")
+        logger.info("Claude selected: %s - %s", matched_track.track_name, reasoning)
         return {
             "is_match": True,
             "confidence": 0.90,
@@ -399,50 +607,14 @@ Which is the best match?"""
 
 
 async def _ai_disambiguate_langchain(
-    original_metadata: SongMetadata, candidates: List[SpotifyTrackResult], candidates_text: str
+    original_metadata: SongMetadata,
+    candidates_by_uri: Dict[str, SpotifyTrackResult],
+    candidates_text: str,
 ) -> Dict:
     """Langchain (OpenAI) disambiguation logic."""
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are an expert music librarian helping match songs from Apple Music to Spotify.
-Given an original song and multiple Spotify candidates, select the best match.
+    chain = _get_openai_chain()
 
-Consider these factors:
-- Artist name variations (e.g., "The Beatles" vs "Beatles")
-- Album names and release dates
-- Remaster vs original versions
-- Live vs studio recordings
-- Featured artists
-- Single vs album versions
-
-Respond with ONLY the URI of the best match and a brief reason (one sentence).
-If none of the candidates is a good match, respond with "NONE" as the URI.
-
-Format your response EXACTLY like this:
-URI: spotify:track:xxxxx (or NONE)
-REASON: Brief explanation in one sentence""",
-            ),
-            (
-                "user",
-                """Original Song:
-Title: {title}
-Artist: {artist}
-Album: {album}
-
-Spotify Candidates:
-{candidates}
-
-Which is the best match?""",
-            ),
-        ]
-    )
-
-    llm = ChatOpenAI(model=settings.ai_model, temperature=0, api_key=settings.openai_api_key)
-    chain = prompt | llm
-
-    logger.info(f"Invoking AI with model: {settings.ai_model}")
+    logger.info("Invoking AI with model: %s", settings.ai_model)
 
     response = await chain.ainvoke(
         {
@@ -454,18 +626,9 @@ Which is the best match?""",
     )
 
     content = response.content
-    logger.debug(f"AI response: {content}")
+    logger.debug("AI response: %s", content)
 
-    # Parse response (same logic as Claude)
-    lines = content.strip().split("\n")
-    uri_line = next((l for l in lines if l.startswith("URI:")), None)
-    reason_line = next((l for l in lines if l.startswith("REASON:")), None)
-
-    if not uri_line or not reason_line:
-        raise ValueError("AI response missing URI or REASON")
-
-    selected_uri = uri_line.replace("URI:", "").strip()
-    reasoning = reason_line.replace("REASON:", "").strip()
+    selected_uri, reasoning = _parse_ai_response(content, "AI")
 
     if selected_uri.upper() == "NONE":
         return {
@@ -476,10 +639,10 @@ Which is the best match?""",
             "reasoning": reasoning,
         }
 
-    matched_track = next((c for c in candidates if c.spotify_uri == selected_uri), None)
+    matched_track = candidates_by_uri.get(selected_uri)
 
     if matched_track:
-        logger.info(f"AI selected: {matched_track.track_name} - {reasoning}")
+        logger.info("AI selected: %s - %s", matched_track.track_name, reasoning)
         return {
             "is_match": True,
             "confidence": 0.90,
@@ -497,9 +660,235 @@ Which is the best match?""",
         }
 
 
+BATCH_SYSTEM_PROMPT = """You are an expert music librarian helping match songs from Apple Music to Spotify.
+You will be given several original songs, each with its own list of Spotify candidates.
+For every song, select the best match among that song's candidates.
+
+Consider these factors:
+- Artist name variations (e.g., "The Beatles" vs "Beatles")
+- Album names and release dates
+- Remaster vs original versions
+- Live vs studio recordings
+- Featured artists
+- Single vs album versions
+
+For each song respond with ONLY the URI of the best match and a brief reason (one sentence).
+If none of a song's candidates is a good match, respond with "NONE" as the URI.
+
+Format your response EXACTLY like this, one block per song:
+SONG: 1
+URI: spotify:track:xxxxx (or NONE)
+REASON: Brief explanation in one sentence"""
+
+_BATCH_ANSWER_RE = re.compile(r"^SONG:\s*(\d+)\s*\nURI:\s*(\S+)[^\n]*\nREASON:\s*(.+)$", re.M)
+
+
+class AIDisambiguationBatcher:
+    """Groups concurrent AI disambiguation requests into shared LLM calls.
+
+    A request is sent straight away while fewer than `concurrency` calls are
+    in flight, so a lone sync never waits. Requests arriving while every slot
+    is busy are held, and when a call finishes they go out together (up to
+    max_batch_size) as one multi-song prompt, amortizing the LLM round-trip
+    across workflows. A request that ends up alone takes the regular
+    single-song path.
+    """
+
+    def __init__(self, max_batch_size: int = 8, concurrency: int = 4):
+        self.max_batch_size = max_batch_size
+        self.concurrency = concurrency
+        self._pending: List[
+            Tuple[SongMetadata, List[SpotifyTrackResult], List[float], asyncio.Future]
+        ] = []
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        original_metadata: SongMetadata,
+        candidates: List[SpotifyTrackResult],
+        fuzzy_scores: List[float],
+    ) -> Dict:
+        """Queue a disambiguation request and wait for its result.
+
+        Args:
+            original_metadata: Original song from Apple Music
+            candidates: Spotify candidates to choose from
+            fuzzy_scores: Fuzzy match score of each candidate
+
+        Returns:
+            Same result dictionary as ai_disambiguate_standalone
+        """
+        if not candidates:
+            return await ai_disambiguate_standalone(original_metadata, candidates, fuzzy_scores)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((original_metadata, candidates, fuzzy_scores, future))
+        self._dispatch()
+        return await future
+
+    def _dispatch(self):
+        """Start batches from pending requests while a call slot is free."""
+        while self._pending and len(self._tasks) < self.concurrency:
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task):
+        """Free a finished batch's slot and send whatever queued up meanwhile."""
+        self._tasks.discard(task)
+        self._dispatch()
+
+    async def _run_batch(self, batch):
+        """Resolve every request in a batch, one LLM call for the lot."""
+        if len(batch) == 1:
+            await self._run_single(*batch[0])
+            return
+
+        try:
+            results = await _ai_disambiguate_batch([item[:3] for item in batch])
+        except Exception as e:
+            for *_, future in batch:
+                _set_future(future, exception=e)
+            return
+
+        # Songs the model skipped are asked about on their own, concurrently;
+        # the task group cancels any still running if this batch is cancelled
+        async with asyncio.TaskGroup() as tg:
+            for idx, item in enumerate(batch, 1):
+                if idx in results:
+                    _set_future(item[3], result=results[idx])
+                else:
+                    tg.create_task(self._run_single(*item))
+
+    async def _run_single(
+        self,
+        original_metadata: SongMetadata,
+        candidates: List[SpotifyTrackResult],
+        fuzzy_scores: List[float],
+        future: asyncio.Future,
+    ):
+        """Resolve one request through the single-song path."""
+        try:
+            result = await ai_disambiguate_standalone(original_metadata, candidates, fuzzy_scores)
+        except Exception as e:
+            _set_future(future, exception=e)
+        else:
+            _set_future(future, result=result)
+
+
+def _set_future(future: asyncio.Future, result=None, exception: Optional[BaseException] = None):
+    """Resolve a future unless its waiter has already gone away."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+async def _ai_disambiguate_batch(
+    requests: List[Tuple[SongMetadata, List[SpotifyTrackResult], List[float]]],
+) -> Dict[int, Dict]:
+    """Disambiguate several songs with a single LLM call.
+
+    Args:
+        requests: (original_metadata, candidates, fuzzy_scores) per song
+
+    Returns:
+        Result dictionaries keyed by 1-based song number; songs the model
+        did not answer are absent
+    """
+    logger.info(
+        "AI disambiguating %d songs in one batch using %s", len(requests), settings.ai_provider
+    )
+
+    song_sections = [
+        f"""
+SONG {idx}
+Original Song:
+Title: {original_metadata.title}
+Artist: {original_metadata.artist}
+Album: {original_metadata.album or "Unknown"}
+
+Spotify Candidates:
+{_format_candidates(candidates, fuzzy_scores)}
+"""
+        for idx, (original_metadata, candidates, fuzzy_scores) in enumerate(requests, 1)
+    ]
+    user_prompt = "".join(song_sections) + "\nWhich is the best match for each song?"
+
+    if settings.ai_provider == "claude":
+        client = _get_anthropic_client()
+        response = await client.messages.create(
+            model=settings.claude_model,
+            max_tokens=1024,
+            temperature=0,
+            system=_cached_system(BATCH_SYSTEM_PROMPT),
+            messages=[{"role": "user", "content": user_prompt}],
+        )
+        content = response.content[0].text
+        match_method = "ai_claude"
+    elif settings.ai_provider == "langchain":
+        response = await _get_openai_llm().ainvoke(
+            [("system", BATCH_SYSTEM_PROMPT), ("user", user_prompt)]
+        )
+        content = response.content
+        match_method = "ai"
+    else:
+        raise ValueError(f"Unknown AI provider: {settings.ai_provider}")
+
+    logger.debug("AI batch response: %s", content)
+
+    results = {}
+    for match in _BATCH_ANSWER_RE.finditer(content):
+        idx = int(match.group(1))
+        if not 1 <= idx <= len(requests):
+            continue
+
+        selected_uri = match.group(2).strip()
+        reasoning = match.group(3).strip()
+        candidates_by_uri = {c.spotify_uri: c for c in requests[idx - 1][1]}
+
+        if selected_uri.upper() == "NONE":
+            results[idx] = {
+                "is_match": False,
+                "confidence": 0.0,
+                "matched_track": None,
+                "match_method": match_method,
+                "reasoning": reasoning,
+            }
+            continue
+
+        matched_track = candidates_by_uri.get(selected_uri)
+        if matched_track:
+            results[idx] = {
+                "is_match": True,
+                "confidence": 0.90,
+                "matched_track": matched_track,
+                "match_method": match_method,
+                "reasoning": reasoning,
+            }
+        else:
+            results[idx] = {
+                "is_match": False,
+                "confidence": 0.0,
+                "matched_track": None,
+                "match_method": "ai_failed",
+                "reasoning": f"AI returned invalid URI: {selected_uri}",
+            }
+
+    return results
+
+
+# Shared batcher for all standalone workflows in this process
+ai_disambiguation_batcher = AIDisambiguationBatcher()
+
+
 async def add_to_playlist_standalone(track_uri: str, playlist_id: str, user_id: str) -> Dict:
     """Add track to playlist (standalone version)."""
-    logger.info(f"Adding track {track_uri} to playlist {playlist_id}")
+    logger.info("Adding track %s to playlist %s", track_uri, playlist_id)
 
     mcp_client = await get_spotify_mcp_client()
 
@@ -511,14 +900,14 @@ async def add_to_playlist_standalone(track_uri: str, playlist_id: str, user_id:
 
     # Add track
     result = await mcp_client.add_track_to_playlist(track_uri, playlist_id)
-    logger.info(f"Successfully added track")
+    logger.info("Successfully added track")
 
     return {"status": "added", "track_uri": track_uri, "snapshot_id": result.get("snapshot_id")}
 
 
 async def verify_track_standalone(track_uri: str, playlist_id: str) -> Dict:
     """Verify track was added (standalone version)."""
-    logger.info(f"Verifying track {track_uri} in playlist {playlist_id}")
+    logger.info("Verifying track %s in playlist %s", track_uri, playlist_id)
 
     try:
         mcp_client = await get_spotify_mcp_client()
@@ -526,7 +915,7 @@ async def verify_track_standalone(track_uri: str, playlist_id: str) -> Dict:
 
         return {"is_added": is_added, "track_uri": track_uri, "playlist_id": playlist_id}
     except Exception as e:
-        logger.error(f"Verification failed: {e}")
+        logger.error("Verification failed: %s", e)
         return {"is_added": False, "track_uri": track_uri, "playlist_id": playlist_id, "error": str(e)}
 
 
@@ -544,22 +933,25 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
     Returns:
         WorkflowResult with execution details
     """
-    start_time = time.time()
+    started = time.monotonic()
 
     # Initialize workflow state
     state = StandaloneWorkflowState(
         workflow_id=workflow_id,
         current_step="initializing",
         candidates_found=0,
-        start_time=start_time,
+        started_at=datetime.now(),
+        started_monotonic=started,
         status="running",
     )
-    workflow_status_store[workflow_id] = state
+    _store_workflow_state(state)
 
     try:
         logger.info(
-            f"[{workflow_id}] Starting sync: {input_data.song_metadata.title} "
-            f"by {input_data.song_metadata.artist}"
+            "[%s] Starting sync: %s by %s",
+            workflow_id,
+            input_data.song_metadata.title,
+            input_data.song_metadata.artist,
         )
 
         # Step 1: Search Spotify (with retry)
@@ -569,18 +961,19 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
             input_data.song_metadata,
             max_attempts=3,
             initial_delay=1.0,
+            retry_on=MCP_RETRYABLE_ERRORS,
         )
 
         state.candidates_found = len(search_results)
 
         if not search_results:
-            logger.info(f"[{workflow_id}] No tracks found on Spotify")
+            logger.info("[%s] No tracks found on Spotify", workflow_id)
             result = WorkflowResult(
                 success=False,
                 message=f"No tracks found on Spotify for '{input_data.song_metadata.title}'",
-                execution_time_seconds=time.time() - start_time,
+                execution_time_seconds=time.monotonic() - started,
             )
-            state.status = "completed"
+            _finish_workflow_state(state, "completed")
             state.result = result
             return result
 
@@ -594,46 +987,53 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
         if not match_result["is_match"] and input_data.use_ai_disambiguation:
             state.current_step = "ai_disambiguation"
             logger.info(
-                f"[{workflow_id}] Fuzzy match below threshold, trying AI disambiguation"
+                "[%s] Fuzzy match below threshold, trying AI disambiguation", workflow_id
             )
 
+            top_candidates = match_result["order"][:5]  # Top 5 candidates only
             ai_match_result = await execute_with_retry(
-                ai_disambiguate_standalone,
+                ai_disambiguation_batcher.submit,
                 input_data.song_metadata,
-                search_results[:5],
-                match_result.get("all_scores", []),
+                [search_results[idx] for idx in top_candidates],
+                [float(match_result["scores"][idx]) for idx in top_candidates],
                 max_attempts=3,
                 initial_delay=2.0,
+                retry_on=AI_RETRYABLE_ERRORS,
             )
 
             if ai_match_result["is_match"]:
                 logger.info(
-                    f"[{workflow_id}] AI found match: {ai_match_result.get('reasoning', 'N/A')}"
+                    "[%s] AI found match: %s",
+                    workflow_id,
+                    ai_match_result.get("reasoning", "N/A"),
                 )
                 match_result = ai_match_result
 
         # Check if we have a match
         if not match_result["is_match"]:
             logger.info(
-                f"[{workflow_id}] No match found above threshold "
-                f"(best: {match_result['confidence']:.2f})"
+                "[%s] No match found above threshold (best: %.2f)",
+                workflow_id,
+                match_result["confidence"],
             )
             result = WorkflowResult(
                 success=False,
                 message=f"No match above threshold {input_data.match_threshold} "
                 f"(best match: {match_result['confidence']:.2f})",
                 confidence_score=match_result["confidence"],
-                execution_time_seconds=time.time() - start_time,
+                execution_time_seconds=time.monotonic() - started,
                 match_method=match_result.get("match_method"),
             )
-            state.status = "completed"
+            _finish_workflow_state(state, "completed")
             state.result = result
             return result
 
         matched_track = match_result["matched_track"]
         logger.info(
-            f"[{workflow_id}] Match found: '{matched_track.track_name}' "
-            f"(confidence: {match_result['confidence']:.2f})"
+            "[%s] Match found: '%s' (confidence: %.2f)",
+            workflow_id,
+            matched_track.track_name,
+            match_result["confidence"],
         )
 
         # Step 3: Add to Playlist (with retry)
@@ -645,6 +1045,7 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
             input_data.user_id,
             max_attempts=10,
             initial_delay=2.0,
+            retry_on=MCP_RETRYABLE_ERRORS,
         )
 
         # Step 4: Verify Addition
@@ -654,14 +1055,19 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
         )
 
         if not verification_result.get("is_added", False):
-            logger.warning(f"[{workflow_id}] Track verification failed, but operation may have succeeded")
+            logger.warning(
+                "[%s] Track verification failed, but operation may have succeeded", workflow_id
+            )
 
         # Success!
         state.current_step = "completed"
-        execution_time = time.time() - start_time
+        execution_time = time.monotonic() - started
 
         logger.info(
-            f"[{workflow_id}] Successfully synced '{matched_track.track_name}' in {execution_time:.2f}s"
+            "[%s] Successfully synced '%s' in %.2fs",
+            workflow_id,
+            matched_track.track_name,
+            execution_time,
         )
 
         result = WorkflowResult(
@@ -674,24 +1080,38 @@ async def run_standalone_workflow(workflow_id: str, input_data: WorkflowInput) -
             match_method=match_result.get("match_method"),
         )
 
-        state.status = "completed"
+        _finish_workflow_state(state, "completed")
         state.result = result
         return result
 
     except Exception as e:
-        logger.error(f"[{workflow_id}] Workflow failed: {e}", exc_info=True)
-        state.status = "failed"
+        logger.error("[%s] Workflow failed: %s", workflow_id, e, exc_info=True)
+        _finish_workflow_state(state, "failed")
         state.error = str(e)
 
         result = WorkflowResult(
             success=False,
             message=f"Workflow failed: {str(e)}",
-            execution_time_seconds=time.time() - start_time,
+            execution_time_seconds=time.monotonic() - started,
         )
         state.result = result
         return result
 
 
+# Steps completed by the time a workflow reaches each step
+_STEPS_COMPLETED = MappingProxyType(
+    {
+        "initializing": 0,
+        "searching": 1,
+        "matching": 2,
+        "ai_disambiguation": 2,
+        "adding": 3,
+        "verifying": 3,
+        "completed": 4,
+    }
+)
+
+
 def get_workflow_progress(workflow_id: str) -> Optional[WorkflowProgress]:
     """
     Get progress for a running standalone workflow.
@@ -703,22 +1123,31 @@ def get_workflow_progress(workflow_id: str) -> Optional[WorkflowProgress]:
     if not state:
         return None
 
-    steps_map = {
-        "initializing": 0,
-        "searching": 1,
-        "matching": 2,
-        "ai_disambiguation": 2,
-        "adding": 3,
-        "verifying": 3,
-        "completed": 4,
-    }
+    return workflow_progress(state)
 
+
+def workflow_progress(state: StandaloneWorkflowState) -> WorkflowProgress:
+    """Build the progress view of an already looked-up workflow state."""
     return WorkflowProgress(
         current_step=state.current_step,
-        steps_completed=steps_map.get(state.current_step, 0),
+        steps_completed=_STEPS_COMPLETED.get(state.current_step, 0),
         steps_total=4,
         candidates_found=state.candidates_found,
-        elapsed_seconds=time.time() - state.start_time,
+        elapsed_seconds=time.monotonic() - state.started_monotonic,
+    )
+
+
+def mark_workflow_queued(workflow_id: str) -> None:
+    """Record an accepted workflow that is waiting for a free worker."""
+    _store_workflow_state(
+        StandaloneWorkflowState(
+            workflow_id=workflow_id,
+            current_step="queued",
+            candidates_found=0,
+            started_at=datetime.now(),
+            started_monotonic=time.monotonic(),
+            status="queued",
+        )
     )
 
 
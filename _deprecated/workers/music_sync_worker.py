@@ -27,8 +27,13 @@ from config.settings import settings
 from workflows.music_sync_workflow import MusicSyncWorkflow
 from activities.spotify_search import search_spotify
 from activities.fuzzy_matcher import fuzzy_match_tracks
-from activities.ai_disambiguator import ai_disambiguate_track
-from activities.playlist_manager import add_track_to_playlist, verify_track_added
+from activities.ai_disambiguator import ai_disambiguate_track, ai_disambiguate_track_batch
+from activities.playlist_manager import (
+    add_track_to_playlist,
+    add_tracks_to_playlist,
+    verify_track_added,
+)
+from mcp_client.client import close_spotify_mcp_client
 
 
 # Configure logging
@@ -93,7 +98,9 @@ async def run_worker():
             search_spotify,
             fuzzy_match_tracks,
             ai_disambiguate_track,
+            ai_disambiguate_track_batch,
             add_track_to_playlist,
+            add_tracks_to_playlist,
             verify_track_added,
         ],
         activity_executor=activity_executor,
@@ -118,6 +125,7 @@ async def run_worker():
         logger.error(f"Worker error: {e}", exc_info=True)
         raise
     finally:
+        await close_spotify_mcp_client()
         activity_executor.shutdown(wait=True)
         logger.info("Worker stopped")
 
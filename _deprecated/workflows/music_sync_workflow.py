@@ -93,7 +93,7 @@ class MusicSyncWorkflow:
                 "ai-disambiguate",
                 args=[
                     input_data.song_metadata,
-                    search_results[:5],  # Top 5 candidates only
+                    search_results,  # Activity prompts with the top-scored few
                     match_result.get("all_scores", []),
                 ],
                 start_to_close_timeout=timedelta(minutes=2),  # LLM can be slow
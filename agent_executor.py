@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
 from models.data_models import SongMetadata, WorkflowResult
@@ -32,37 +33,14 @@ class AgentExecutionResult:
     error: Optional[str] = None
 
 
-async def execute_music_sync_with_agent(
-    song_metadata: SongMetadata,
-    playlist_id: str,
-    user_id: str = "anonymous",
-    use_ai_disambiguation: bool = True
-) -> AgentExecutionResult:
+@lru_cache(maxsize=1)
+def _get_agent_options() -> ClaudeAgentOptions:
     """
-    Execute music sync using Claude Agent SDK.
-
-    Claude intelligently uses Spotify MCP tools to:
-    1. Search for the track
-    2. Analyze and pick the best match (with AI reasoning)
-    3. Add to playlist
-    4. Verify addition
-
-    Args:
-        song_metadata: Song to search for
-        playlist_id: Target Spotify playlist ID
-        user_id: User identifier
-        use_ai_disambiguation: Whether to use AI for ambiguous matches
+    Claude Agent SDK options for music sync, built once.
 
-    Returns:
-        AgentExecutionResult with success status and details
+    Nothing here depends on the request, so every sync shares one instance.
     """
-    import time
-    start_time = time.time()
-
-    logger.info(f"Starting agent-based sync for: {song_metadata}")
-
-    # Configure Claude Agent SDK
-    options = ClaudeAgentOptions(
+    return ClaudeAgentOptions(
         # Connect to Spotify MCP server
         mcp_servers={
             "spotify": {
@@ -116,6 +94,36 @@ IMPORTANT: Return your response in this EXACT JSON format:
         max_turns=10,  # Limit conversation length
     )
 
+
+async def execute_music_sync_with_agent(
+    song_metadata: SongMetadata,
+    playlist_id: str,
+    user_id: str = "anonymous",
+    use_ai_disambiguation: bool = True
+) -> AgentExecutionResult:
+    """
+    Execute music sync using Claude Agent SDK.
+
+    Claude intelligently uses Spotify MCP tools to:
+    1. Search for the track
+    2. Analyze and pick the best match (with AI reasoning)
+    3. Add to playlist
+    4. Verify addition
+
+    Args:
+        song_metadata: Song to search for
+        playlist_id: Target Spotify playlist ID
+        user_id: User identifier
+        use_ai_disambiguation: Whether to use AI for ambiguous matches
+
+    Returns:
+        AgentExecutionResult with success status and details
+    """
+    import time
+    start_time = time.time()
+
+    logger.info(f"Starting agent-based sync for: {song_metadata}")
+
     # Create the prompt for Claude
     disambiguation_note = "Use your best judgment to pick the most accurate match." if use_ai_disambiguation else "Only pick exact matches."
 
@@ -137,7 +145,7 @@ Instructions:
 Begin the search now."""
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with ClaudeSDKClient(options=_get_agent_options()) as client:
             # Send the sync request to Claude
             await client.query(prompt)
 
@@ -153,7 +161,7 @@ Begin the search now."""
                 if hasattr(message, 'subtype') and message.subtype in ['success', 'error']:
                     if message.subtype == 'error':
                         error_msg = getattr(message, 'result', 'Unknown error')
-                        logger.error(f"Agent execution failed: {error_msg}")
+                        logger.error("Agent execution failed: %s", error_msg)
                         return AgentExecutionResult(
                             success=False,
                             message=f"Agent error: {error_msg}",
@@ -192,7 +200,8 @@ Begin the search now."""
                 )
 
     except Exception as e:
-        logger.error(f"Agent execution exception: {e}", exc_info=True)
+        logger.error("Agent execution exception: %s", e)
+        logger.debug("Agent execution traceback:", exc_info=True)
         return AgentExecutionResult(
             success=False,
             message=f"Agent execution failed: {str(e)}",
@@ -207,16 +216,12 @@ def _parse_agent_response(response_text: str) -> Dict[str, Any]:
 
     Looks for JSON in the response or extracts key information.
     """
-    import json
     import re
 
     # Try to find JSON block
-    json_match = re.search(r'\{[\s\S]*\}', response_text)
-    if json_match:
-        try:
-            return json.loads(json_match.group(0))
-        except json.JSONDecodeError:
-            pass
+    json_result = _find_json_object(response_text)
+    if json_result is not None:
+        return json_result
 
     # Fallback: Extract key information from text
     result = {
@@ -243,6 +248,52 @@ def _parse_agent_response(response_text: str) -> Dict[str, Any]:
     return result
 
 
+def _find_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the last top-level JSON object in free-form text.
+
+    Scans once, tracking brace depth and skipping braces inside JSON strings,
+    to collect every balanced top-level {...} span. Spans are then tried from
+    last to first, since the agent's final answer comes after any tool-call
+    JSON it echoed earlier.
+    """
+    import json
+
+    spans = []
+    depth = 0
+    start = 0
+    in_string = False
+    escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif depth:
+            if char == '"':
+                in_string = True
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    spans.append((start, i + 1))
+
+    for start, end in reversed(spans):
+        try:
+            parsed = json.loads(text[start:end])
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
 async def get_agent_workflow_progress(workflow_id: str) -> Dict[str, Any]:
     """
     Get workflow progress (stub for compatibility with API).
@@ -7,7 +7,14 @@ natural language commands.
 import asyncio
 import sys
 from pathlib import Path
-from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+from claude_agent_sdk import (
+    ClaudeSDKClient,
+    ClaudeAgentOptions,
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+)
 
 
 async def main():
@@ -73,22 +80,23 @@ async def main():
             print(f"[Turn {turn}] Claude: ", end="", flush=True)
 
             response_parts = []
+            write = sys.stdout.write
             async for message in client.receive_response():
                 # Handle different message types
-                if hasattr(message, 'content'):
+                if isinstance(message, AssistantMessage):
                     for block in message.content:
-                        if hasattr(block, 'text'):
+                        if isinstance(block, TextBlock):
                             response_parts.append(block.text)
-                            print(block.text, end="", flush=True)
-                        elif hasattr(block, 'name'):
-                            # Tool use
-                            print(f"\n  [Using tool: {block.name}]", flush=True)
+                            write(block.text)
+                        elif isinstance(block, ToolUseBlock):
+                            write(f"\n  [Using tool: {block.name}]\n")
+                    sys.stdout.flush()
 
-                # Check if this is the final result
-                if hasattr(message, 'subtype') and message.subtype in ['success', 'error']:
+                # The result message ends the response
+                elif isinstance(message, ResultMessage):
                     print()  # New line after response
-                    if message.subtype == 'error':
-                        print(f"\n  ⚠️ Error occurred: {getattr(message, 'result', 'Unknown error')}")
+                    if message.is_error:
+                        print(f"\n  ⚠️ Error occurred: {message.result or 'Unknown error'}")
                     break
 
 
@@ -6,15 +6,26 @@ Claude intelligently orchestrates Spotify MCP tools.
 """
 import asyncio
 import logging
+import secrets
 import time
-import uuid
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional, Any
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-
-from api.models import SyncSongRequest, SyncSongResponse, WorkflowStatusResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import Message, Receive, Scope, Send
+
+from api.models import (
+    SyncSongRequest,
+    SyncSongResponse,
+    WorkflowProgressInfo,
+    WorkflowResultInfo,
+    WorkflowStatusResponse,
+)
 from models.data_models import SongMetadata
+from utils.ttl_cache import TTLCache
 from agent_executor import execute_music_sync_with_agent, AgentExecutionResult
 
 # Configure logging
@@ -30,17 +41,58 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+
+class _OriginOnlyCORSMiddleware(CORSMiddleware):
+    """CORS middleware that skips requests without an Origin header.
+
+    Server-to-server callers (and iOS Shortcuts) never send Origin, so their
+    requests skip CORS header handling. Their responses still carry
+    ``Vary: Origin``, as CORSMiddleware would add, so a shared cache never
+    serves one of them to a browser request that needs CORS headers.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or any(name == b"origin" for name, _ in scope["headers"]):
+            await super().__call__(scope, receive, send)
+            return
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_vary)
+
+
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    _OriginOnlyCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# In-memory storage for execution results (for status endpoint)
-execution_results: dict[str, AgentExecutionResult] = {}
+
+@dataclass
+class _Execution:
+    """Timing and, once finished, the result of one agent sync."""
+    started_at: datetime
+    result: Optional[AgentExecutionResult] = None
+    completed_at: Optional[datetime] = None
+
+
+# In-memory storage for executions (for status endpoint), bounded so a
+# long-running server does not grow without limit: entries expire after the TTL
+# and the least recently used entry is evicted once the cap is reached
+EXECUTION_RESULTS_TTL_SECONDS = 3600
+EXECUTION_RESULTS_MAX_ENTRIES = 10_000
+execution_results: "TTLCache[str, _Execution]" = TTLCache(
+    EXECUTION_RESULTS_TTL_SECONDS, EXECUTION_RESULTS_MAX_ENTRIES
+)
+
+# Strong references to in-flight sync tasks; the event loop only keeps weak ones
+_background_tasks: set[asyncio.Task] = set()
 
 
 @app.on_event("startup")
@@ -50,6 +102,15 @@ async def startup_event():
     logger.info("🎵 Ready to sync songs intelligently using AI!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Cancel sync tasks that are still running."""
+    for task in _background_tasks:
+        task.cancel()
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
+
+
 @app.post("/api/v1/sync", response_model=SyncSongResponse, status_code=status.HTTP_202_ACCEPTED)
 async def sync_song(request: SyncSongRequest) -> SyncSongResponse:
     """
@@ -70,11 +131,15 @@ async def sync_song(request: SyncSongRequest) -> SyncSongResponse:
     """
     # Generate workflow ID
     user_id = request.user_id or "anonymous"
-    timestamp = int(time.time())
-    random_suffix = uuid.uuid4().hex[:5]
+    started_at = datetime.now()
+    timestamp = int(started_at.timestamp())
+    random_suffix = secrets.token_hex(3)
     workflow_id = f"agent-sync-{user_id}-{timestamp}-{random_suffix}"
 
-    logger.info(f"[{workflow_id}] Starting agent-based sync for: {request.track_name} by {request.artist}")
+    logger.info(
+        "[%s] Starting agent-based sync for: %s by %s",
+        workflow_id, request.track_name, request.artist,
+    )
 
     # Create song metadata
     song_metadata = SongMetadata(
@@ -83,18 +148,23 @@ async def sync_song(request: SyncSongRequest) -> SyncSongResponse:
         album=request.album
     )
 
-    # Execute in background task (fire-and-forget)
-    asyncio.create_task(
+    execution_results.set(workflow_id, _Execution(started_at=started_at))
+
+    # Execute in background task on the server's event loop
+    task = asyncio.create_task(
         _execute_sync_task(
             workflow_id=workflow_id,
+            started_at=started_at,
             song_metadata=song_metadata,
             playlist_id=request.playlist_id,
             user_id=user_id,
             use_ai_disambiguation=request.use_ai_disambiguation
         )
     )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-    return SyncSongResponse(
+    return SyncSongResponse.model_construct(
         workflow_id=workflow_id,
         status="accepted",
         message=f"Agent is searching for '{request.track_name}' by {request.artist}...",
@@ -104,6 +174,7 @@ async def sync_song(request: SyncSongRequest) -> SyncSongResponse:
 
 async def _execute_sync_task(
     workflow_id: str,
+    started_at: datetime,
     song_metadata: SongMetadata,
     playlist_id: str,
     user_id: str,
@@ -111,7 +182,7 @@ async def _execute_sync_task(
 ):
     """Execute the sync task in background and cache results."""
     try:
-        logger.info(f"[{workflow_id}] Calling Agent SDK...")
+        logger.info("[%s] Calling Agent SDK...", workflow_id)
 
         result = await execute_music_sync_with_agent(
             song_metadata=song_metadata,
@@ -121,24 +192,25 @@ async def _execute_sync_task(
         )
 
         # Cache result for status endpoint
-        execution_results[workflow_id] = result
+        execution_results.set(workflow_id, _Execution(started_at, result, datetime.now()))
 
         if result.success:
             logger.info(
-                f"[{workflow_id}] ✅ Success! "
-                f"Matched: {result.matched_track_name} by {result.matched_artist} "
-                f"({result.match_method})"
+                "[%s] ✅ Success! Matched: %s by %s (%s)",
+                workflow_id, result.matched_track_name, result.matched_artist,
+                result.match_method,
             )
         else:
-            logger.error(f"[{workflow_id}] ❌ Failed: {result.error}")
+            logger.error("[%s] ❌ Failed: %s", workflow_id, result.error)
 
     except Exception as e:
-        logger.error(f"[{workflow_id}] Exception during agent execution: {e}", exc_info=True)
-        execution_results[workflow_id] = AgentExecutionResult(
+        logger.error("[%s] Exception during agent execution: %s", workflow_id, e, exc_info=True)
+        result = AgentExecutionResult(
             success=False,
             message=f"Exception: {str(e)}",
             error=str(e)
         )
+        execution_results.set(workflow_id, _Execution(started_at, result, datetime.now()))
 
 
 @app.get("/api/v1/sync/{workflow_id}", response_model=WorkflowStatusResponse)
@@ -152,40 +224,39 @@ async def get_sync_status(workflow_id: str) -> WorkflowStatusResponse:
     Returns:
         Current workflow status and results
     """
-    from datetime import datetime
-
     # Check if we have results for this workflow
-    if workflow_id not in execution_results:
+    execution = execution_results.get(workflow_id)
+    if execution is None or execution.result is None:
         # Still running or doesn't exist
-        from api.models import WorkflowProgressInfo
-        return WorkflowStatusResponse(
+        now = datetime.now()
+        started_at = execution.started_at if execution is not None else now
+        return WorkflowStatusResponse.model_construct(
             workflow_id=workflow_id,
             status="running",
-            started_at=datetime.now(),
-            progress=WorkflowProgressInfo(
+            started_at=started_at,
+            progress=WorkflowProgressInfo.model_construct(
                 current_step="agent_processing",
                 steps_completed=1,
                 steps_total=4,
                 candidates_found=0,
-                elapsed_seconds=0.0
+                elapsed_seconds=(now - started_at).total_seconds()
             )
         )
 
-    result = execution_results[workflow_id]
+    result = execution.result
 
     if result.success:
-        from api.models import WorkflowResultInfo
         # Extract track ID from URI (format: spotify:track:TRACK_ID)
         spotify_track_id = None
         if result.matched_track_uri:
             spotify_track_id = result.matched_track_uri.split(":")[-1]
 
-        return WorkflowStatusResponse(
+        return WorkflowStatusResponse.model_construct(
             workflow_id=workflow_id,
             status="completed",
-            started_at=datetime.now(),
-            completed_at=datetime.now(),
-            result=WorkflowResultInfo(
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
+            result=WorkflowResultInfo.model_construct(
                 success=True,
                 message=result.message,
                 spotify_track_id=spotify_track_id,
@@ -197,11 +268,11 @@ async def get_sync_status(workflow_id: str) -> WorkflowStatusResponse:
             )
         )
     else:
-        return WorkflowStatusResponse(
+        return WorkflowStatusResponse.model_construct(
             workflow_id=workflow_id,
             status="failed",
-            started_at=datetime.now(),
-            completed_at=datetime.now(),
+            started_at=execution.started_at,
+            completed_at=execution.completed_at,
             error=result.error
         )
 
@@ -20,10 +20,12 @@ class Settings(BaseSettings):
     # OpenAI Configuration (used when ai_provider="langchain")
     openai_api_key: Optional[str] = None
     ai_model: str = "gpt-4"  # Used for Langchain provider
+    ai_model_small: Optional[str] = None  # Tried before ai_model when set (e.g. "gpt-4o-mini")
 
     # Anthropic Configuration (used when ai_provider="claude")
     anthropic_api_key: Optional[str] = None
     claude_model: str = "claude-3-5-sonnet-20241022"  # Used for Claude provider
+    claude_model_small: Optional[str] = None  # Tried before claude_model when set
 
     # Temporal Configuration
     # USE_TEMPORAL: Feature flag to enable/disable Temporal orchestration
@@ -45,15 +47,19 @@ class Settings(BaseSettings):
     api_host: str = "0.0.0.0"
     api_port: int = 8000
     api_workers: int = 4
+    event_loop: Literal["auto", "uvloop", "asyncio"] = "auto"  # auto picks uvloop when installed
 
     # Matching Configuration
     fuzzy_match_threshold: float = 0.85
     use_ai_disambiguation: bool = True
+    ai_max_candidates: int = 5  # Top fuzzy-scored candidates shown to the LLM
 
     # Worker Configuration
     max_concurrent_activities: int = 100
     max_concurrent_workflows: int = 50
     max_activities_per_second: float = 10.0
+    standalone_workers: int = 8  # Standalone mode: syncs run concurrently
+    standalone_queue_size: int = 1000  # Standalone mode: accepted syncs waiting for a worker
 
     # Logging
     log_level: str = "INFO"
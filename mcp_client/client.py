@@ -2,13 +2,43 @@
 
 import json
 import asyncio
+import logging
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+import anyio
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+logger = logging.getLogger(__name__)
+
+# How often the shared client pings the server, and how long a ping may take
+MCP_HEARTBEAT_INTERVAL_SECONDS = 30.0
+MCP_PING_TIMEOUT_SECONDS = 5.0
+
+# Errors from call_tool that mean the server connection itself is gone
+MCP_TRANSPORT_ERRORS = (
+    ConnectionError,
+    OSError,
+    anyio.BrokenResourceError,
+    anyio.ClosedResourceError,
+)
+# JSON-RPC error code the MCP SDK raises with once the server's pipe closes
+MCP_CONNECTION_CLOSED_CODE = -32000
+
+
+class TransientToolError(ValueError):
+    """A tool error Spotify reported as temporary (rate limit or server error)."""
+
+
+def _is_transport_error(error: Exception) -> bool:
+    """Whether an error from a tool call means the server connection is gone."""
+    if isinstance(error, MCP_TRANSPORT_ERRORS):
+        return True
+    code = getattr(getattr(error, "error", None), "code", None)
+    return code == MCP_CONNECTION_CLOSED_CODE
+
 
 class SpotifyMCPClient:
     """Client for communicating with Spotify MCP server."""
@@ -22,7 +52,9 @@ class SpotifyMCPClient:
         self.session: Optional[ClientSession] = None
         self.read_stream = None
         self.write_stream = None
-        self._stdio_context = None
+        self._connection_task: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._alive = False
 
         if server_script_path is None:
             # Default to mcp_server/spotify_server.py
@@ -35,15 +67,76 @@ class SpotifyMCPClient:
 
     async def connect(self):
         """Connect to the MCP server."""
-        if self.session is not None:
+        if self._connection_task is not None:
             raise RuntimeError("Client is already connected")
 
-        # stdio_client is an async context manager
-        self._stdio_context = stdio_client(self.server_params)
-        self.read_stream, self.write_stream = await self._stdio_context.__aenter__()
-        self.session = ClientSession(self.read_stream, self.write_stream)
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._connection_task = asyncio.create_task(self._run_connection(ready))
+        try:
+            await ready
+        except BaseException:
+            self._connection_task.cancel()
+            self._connection_task = None
+            raise
+        self._alive = True
+
+    async def _run_connection(self, ready: asyncio.Future):
+        """Own the stdio transport and session until close() is called.
+
+        anyio requires a context to be exited by the task that entered it, so
+        the server process is started and shut down here rather than in
+        whichever task happens to call connect() or close().
+
+        Args:
+            ready: Resolved once the session is initialized, or failed with the
+                error that prevented it
+        """
+        try:
+            async with stdio_client(self.server_params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    self.read_stream, self.write_stream = read_stream, write_stream
+                    self.session = session
+                    ready.set_result(None)
+                    await self._closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("Error shutting down MCP server connection: %s", e)
+        finally:
+            if not ready.done():
+                # Cancelled before the session came up; don't leave connect() waiting
+                ready.set_exception(ConnectionError("MCP server connection was cancelled"))
+                ready.exception()  # Mark retrieved when connect() is no longer waiting
+            self._alive = False
+            self.session = None
+            self.read_stream = self.write_stream = None
+
+    def is_alive(self) -> bool:
+        """Whether the client is connected and its last health check passed."""
+        return self.session is not None and self._alive
+
+    async def ping(self, timeout: float = MCP_PING_TIMEOUT_SECONDS) -> bool:
+        """Check that the server still responds, marking the client dead if not.
+
+        Args:
+            timeout: Seconds to wait for the server's reply
 
-        await self.session.initialize()
+        Returns:
+            True if the server answered in time
+        """
+        if self.session is None:
+            return False
+
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout)
+        except Exception as e:
+            logger.warning("MCP server ping failed: %s", e)
+            self._alive = False
+            return False
+        return True
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Call an MCP tool and return the parsed result.
@@ -57,12 +150,24 @@ class SpotifyMCPClient:
 
         Raises:
             RuntimeError: If client is not connected
-            ValueError: If tool returns an error
+            ConnectionError: If the connection to the server was lost
+            TransientToolError: If Spotify rate limited the call or failed with a 5xx
+            ValueError: If tool returns any other error
         """
         if self.session is None:
             raise RuntimeError("Client is not connected. Call connect() first.")
 
-        result = await self.session.call_tool(tool_name, arguments)
+        try:
+            result = await self.session.call_tool(tool_name, arguments)
+        except Exception as e:
+            if not _is_transport_error(e):
+                raise
+            # Let the next get_spotify_mcp_client() reconnect instead of
+            # waiting for the heartbeat to notice
+            self._alive = False
+            if isinstance(e, OSError):  # ConnectionError included
+                raise
+            raise ConnectionError(f"MCP server connection lost: {e}") from e
 
         # Parse result content
         if result.content and len(result.content) > 0:
@@ -71,7 +176,11 @@ class SpotifyMCPClient:
 
             # Check for errors in response
             if "error" in parsed:
-                raise ValueError(f"Tool '{tool_name}' returned error: {parsed['error']}")
+                message = f"Tool '{tool_name}' returned error: {parsed['error']}"
+                http_status = parsed.get("http_status")
+                if http_status is not None and (http_status == 429 or http_status >= 500):
+                    raise TransientToolError(message)
+                raise ValueError(message)
 
             return parsed
 
@@ -103,6 +212,34 @@ class SpotifyMCPClient:
             "add_track_to_playlist", {"track_uri": track_uri, "playlist_id": playlist_id}
         )
 
+    async def add_tracks_to_playlist(
+        self, track_uris: List[str], playlist_id: str
+    ) -> Dict[str, Any]:
+        """Add several tracks to a playlist in bulk.
+
+        Args:
+            track_uris: Spotify track URIs
+            playlist_id: Spotify playlist ID
+
+        Returns:
+            Snapshot ID of the playlist after modification
+        """
+        return await self.call_tool(
+            "add_tracks_to_playlist", {"track_uris": track_uris, "playlist_id": playlist_id}
+        )
+
+    async def list_playlist_tracks(self, playlist_id: str) -> List[str]:
+        """List the URIs of every track in a playlist.
+
+        Args:
+            playlist_id: Spotify playlist ID
+
+        Returns:
+            Track URIs in playlist order
+        """
+        result = await self.call_tool("get_playlist_tracks", {"playlist_id": playlist_id})
+        return result.get("track_uris", [])
+
     async def get_audio_features(self, track_id: str) -> Dict[str, Any]:
         """Get audio features for a track.
 
@@ -153,15 +290,13 @@ class SpotifyMCPClient:
         return result.get("track") if result.get("found") else None
 
     async def close(self):
-        """Close the MCP connection."""
-        if self.session is not None:
-            await self.session.close()
-            self.session = None
-
-        # Exit the stdio context manager
-        if hasattr(self, '_stdio_context') and self._stdio_context is not None:
-            await self._stdio_context.__aexit__(None, None, None)
-            self._stdio_context = None
+        """Close the MCP connection and stop the server process."""
+        self._alive = False
+        task, self._connection_task = self._connection_task, None
+        if task is None:
+            return
+        self._closing.set()
+        await task
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -175,18 +310,72 @@ class SpotifyMCPClient:
 
 # Singleton instance for reuse across activities
 _global_client: Optional[SpotifyMCPClient] = None
+_global_client_lock = asyncio.Lock()
+_heartbeat_task: Optional[asyncio.Task] = None
 
 
 async def get_spotify_mcp_client() -> SpotifyMCPClient:
     """Get or create a global MCP client instance.
 
+    Once connected, the shared client is returned without taking the lock.
+    Concurrent first calls wait for a single connection instead of each
+    spawning their own server process. A client whose server stopped
+    answering health checks is replaced on the next call.
+
     Returns:
         Connected SpotifyMCPClient instance
     """
-    global _global_client
+    global _global_client, _heartbeat_task
+
+    client = _global_client
+    if client is not None and client.is_alive():
+        return client
 
-    if _global_client is None:
-        _global_client = SpotifyMCPClient()
-        await _global_client.connect()
+    async with _global_client_lock:
+        if _global_client is None or not _global_client.is_alive():
+            if _global_client is not None:
+                await _close_quietly(_global_client)
+            client = SpotifyMCPClient()
+            await client.connect()
+            _global_client = client
+
+        if _heartbeat_task is None or _heartbeat_task.done():
+            _heartbeat_task = asyncio.create_task(_heartbeat_loop())
 
     return _global_client
+
+
+async def close_spotify_mcp_client():
+    """Stop the heartbeat and close the global MCP client, if one was created."""
+    global _global_client, _heartbeat_task
+
+    async with _global_client_lock:
+        task, _heartbeat_task = _heartbeat_task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+        client, _global_client = _global_client, None
+        if client is not None:
+            await _close_quietly(client)
+
+
+async def _heartbeat_loop():
+    """Ping the shared client periodically until its server stops answering.
+
+    A failed ping leaves the client marked dead, so the next
+    get_spotify_mcp_client() call reconnects (and restarts this loop).
+    """
+    while True:
+        await asyncio.sleep(MCP_HEARTBEAT_INTERVAL_SECONDS)
+        client = _global_client
+        if client is None or not await client.ping():
+            return
+
+
+async def _close_quietly(client: SpotifyMCPClient):
+    """Close a dead client, ignoring errors from its already-broken transport."""
+    try:
+        await client.close()
+    except Exception as e:
+        logger.warning("Error closing stale MCP client: %s", e)
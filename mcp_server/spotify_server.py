@@ -24,6 +24,9 @@ load_dotenv()
 # Initialize MCP server
 app = Server("spotify-mcp-server")
 
+# Spotify accepts at most 100 URIs per add-items request
+PLAYLIST_ADD_BATCH_SIZE = 100
+
 # Spotify client (will be initialized in main)
 spotify_client: spotipy.Spotify = None
 
@@ -69,6 +72,39 @@ async def list_tools() -> List[Tool]:
                 "required": ["track_uri", "playlist_id"],
             },
         ),
+        Tool(
+            name="add_tracks_to_playlist",
+            description="Add several tracks to a Spotify playlist in bulk",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "track_uris": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Spotify track URIs (spotify:track:xxxxx)",
+                    },
+                    "playlist_id": {
+                        "type": "string",
+                        "description": "Spotify playlist ID",
+                    },
+                },
+                "required": ["track_uris", "playlist_id"],
+            },
+        ),
+        Tool(
+            name="get_playlist_tracks",
+            description="List the URIs of all tracks in a playlist",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "playlist_id": {
+                        "type": "string",
+                        "description": "Spotify playlist ID",
+                    },
+                },
+                "required": ["playlist_id"],
+            },
+        ),
         Tool(
             name="verify_track_added",
             description="Check if a track exists in a playlist",
@@ -153,6 +189,29 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, str]
             )
             return [{"type": "text", "text": json.dumps(result)}]
 
+        elif name == "add_tracks_to_playlist":
+            track_uris = arguments["track_uris"]
+            result = {}
+            for start in range(0, len(track_uris), PLAYLIST_ADD_BATCH_SIZE):
+                result = spotify_client.playlist_add_items(
+                    arguments["playlist_id"], track_uris[start : start + PLAYLIST_ADD_BATCH_SIZE]
+                )
+            return [{"type": "text", "text": json.dumps(result)}]
+
+        elif name == "get_playlist_tracks":
+            playlist_tracks = spotify_client.playlist_items(
+                arguments["playlist_id"], fields="items.track.uri,next", limit=100
+            )
+
+            track_uris = [item["track"]["uri"] for item in playlist_tracks["items"] if item["track"]]
+            while playlist_tracks["next"]:
+                playlist_tracks = spotify_client.next(playlist_tracks)
+                track_uris.extend(
+                    item["track"]["uri"] for item in playlist_tracks["items"] if item["track"]
+                )
+
+            return [{"type": "text", "text": json.dumps({"track_uris": track_uris})}]
+
         elif name == "verify_track_added":
             # Get playlist tracks (may need pagination for large playlists)
             playlist_tracks = spotify_client.playlist_items(
@@ -212,7 +271,14 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Dict[str, str]
             raise ValueError(f"Unknown tool: {name}")
 
     except Exception as e:
-        error_response = {"error": str(e), "tool": name, "arguments": arguments}
+        error_response = {
+            "error": str(e),
+            # Spotify's HTTP status (if any) lets clients tell rate limits and
+            # server errors apart from permanent failures
+            "http_status": getattr(e, "http_status", None),
+            "tool": name,
+            "arguments": arguments,
+        }
         return [{"type": "text", "text": json.dumps(error_response)}]
 
 
@@ -1,11 +1,12 @@
 """Core data models for the Apple Music to Spotify sync system."""
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional, List
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SongMetadata:
     """Song information from Apple Music."""
 
@@ -44,6 +45,20 @@ class SpotifyTrackResult:
     release_date: str
     isrc: Optional[str] = None
 
+    # Lowercased names for fuzzy matching, computed once per result. They are
+    # not dataclass fields, so they are left out of serialization.
+    @cached_property
+    def track_name_lc(self) -> str:
+        return self.track_name.lower()
+
+    @cached_property
+    def artist_name_lc(self) -> str:
+        return self.artist_name.lower()
+
+    @cached_property
+    def album_name_lc(self) -> str:
+        return (self.album_name or "").lower()
+
     def __str__(self) -> str:
         return f"'{self.track_name}' by {self.artist_name} on {self.album_name}"
 
@@ -65,7 +80,7 @@ class MatchResult:
         return f"No match (best: {self.confidence_score:.2f})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WorkflowInput:
     """Input to MusicSyncWorkflow."""
 
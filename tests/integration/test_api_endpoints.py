@@ -1,11 +1,13 @@
 """Integration tests for FastAPI endpoints."""
 
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
-from fastapi import status
+from fastapi import HTTPException, status
 from fastapi.testclient import TestClient
 
+import api.app as app_module
 from api.app import app
 from api.models import (
     SyncSongRequest,
@@ -443,3 +445,152 @@ class TestHealthCheckEndpoint:
         data = response.json()
         assert data["status"] == "unhealthy"
         assert data["temporal_connected"] is False
+
+
+def _describe(status_name: str) -> Mock:
+    """Build a Temporal workflow description with the given status."""
+    description = Mock()
+    description.status.name = status_name
+    description.start_time = datetime(2025, 11, 9, 10, 30, 0)
+    description.close_time = datetime(2025, 11, 9, 10, 30, 36)
+    return description
+
+
+@pytest.fixture
+def temporal_status_lookup():
+    """Point the Temporal status lookup at a mocked client with empty caches."""
+    client = Mock()
+    app_module._status_inflight.clear()
+    app_module._terminal_status_cache.clear()
+    with patch("api.app.temporal_client", client), \
+            patch("api.app.MusicSyncWorkflow", Mock(), create=True):
+        yield client
+    app_module._status_inflight.clear()
+    app_module._terminal_status_cache.clear()
+
+
+class TestWorkflowStatusSharing:
+    """Tests for concurrent status polls sharing one Temporal lookup."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_polls_share_one_describe(self, temporal_status_lookup):
+        """Test that concurrent polls for one workflow make a single describe call."""
+        release = asyncio.Event()
+
+        async def slow_describe():
+            await release.wait()
+            return _describe("RUNNING")
+
+        handle = AsyncMock()
+        handle.describe = AsyncMock(side_effect=slow_describe)
+        temporal_status_lookup.get_workflow_handle.return_value = handle
+
+        polls = [
+            asyncio.create_task(app_module._workflow_status_temporal("sync-shared"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*polls)
+
+        handle.describe.assert_awaited_once()
+        assert [r.status for r in responses] == ["running", "running"]
+        assert not app_module._status_inflight
+
+    @pytest.mark.asyncio
+    async def test_leader_error_reaches_every_poll(self, temporal_status_lookup):
+        """Test that a failed lookup raises the same HTTPException in every poll."""
+        release = asyncio.Event()
+
+        async def failing_describe():
+            await release.wait()
+            raise RuntimeError("workflow not found")
+
+        handle = AsyncMock()
+        handle.describe = AsyncMock(side_effect=failing_describe)
+        temporal_status_lookup.get_workflow_handle.return_value = handle
+
+        polls = [
+            asyncio.create_task(app_module._workflow_status_temporal("sync-missing"))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*polls, return_exceptions=True)
+
+        handle.describe.assert_awaited_once()
+        assert all(isinstance(r, HTTPException) for r in results)
+        assert [r.status_code for r in results] == [status.HTTP_404_NOT_FOUND] * 2
+        assert not app_module._status_inflight
+
+
+class TestTerminalStatusCache:
+    """Tests for answering polls of finished workflows without Temporal."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_status_served_from_cache(self, temporal_status_lookup):
+        """Test that a finished workflow's status is cached and served without Temporal."""
+        handle = AsyncMock()
+        handle.describe = AsyncMock(return_value=_describe("CANCELED"))
+        temporal_status_lookup.get_workflow_handle.return_value = handle
+
+        first = await app_module._workflow_status_temporal("sync-done")
+        temporal_status_lookup.get_workflow_handle.side_effect = AssertionError("Temporal called")
+        second = await app_module._workflow_status_temporal("sync-done")
+
+        assert first.status == second.status == "cancelled"
+        handle.describe.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_running_status_not_cached(self, temporal_status_lookup):
+        """Test that every poll of a running workflow asks Temporal again."""
+        handle = AsyncMock()
+        handle.describe = AsyncMock(return_value=_describe("RUNNING"))
+        temporal_status_lookup.get_workflow_handle.return_value = handle
+
+        await app_module._workflow_status_temporal("sync-running")
+        await app_module._workflow_status_temporal("sync-running")
+
+        assert handle.describe.await_count == 2
+        assert len(app_module._terminal_status_cache) == 0
+
+
+@pytest.mark.skipif(
+    app_module.settings.use_temporal, reason="worker pool only runs in standalone mode"
+)
+class TestStandaloneWorkerPool:
+    """Tests for the bounded standalone worker pool."""
+
+    def test_full_queue_rejects_sync(self, client):
+        """Test that a sync is rejected with 503 while the queue is full."""
+        full_queue = asyncio.Queue(maxsize=1)
+        full_queue.put_nowait(("sync-queued", Mock()))
+        request_data = {
+            "track_name": "Bohemian Rhapsody",
+            "artist": "Queen",
+            "playlist_id": "37i9dQZF1DXcBWIGoYBM5M",
+        }
+
+        with patch("api.app._standalone_queue", full_queue):
+            response = client.post("/api/v1/sync", json=request_data)
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert full_queue.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_crashing_workflow(self):
+        """Test that a worker keeps running queued workflows after one crashes."""
+        run = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        queue = asyncio.Queue()
+        queue.put_nowait(("sync-crash", Mock()))
+        queue.put_nowait(("sync-next", Mock()))
+
+        with patch("api.app.run_standalone_workflow", run):
+            worker = asyncio.create_task(app_module._standalone_worker(queue))
+            await asyncio.wait_for(queue.join(), timeout=1)
+
+            assert not worker.done()
+            worker.cancel()
+            await asyncio.gather(worker, return_exceptions=True)
+
+        assert [c.args[0] for c in run.await_args_list] == ["sync-crash", "sync-next"]
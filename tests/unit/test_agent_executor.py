@@ -0,0 +1,67 @@
+"""Unit tests for parsing the agent's final answer."""
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+from agent_executor import _find_json_object  # noqa: E402
+
+
+class TestFindJsonObject:
+    """Tests for extracting the agent's JSON answer from free-form text."""
+
+    def test_object_in_prose(self):
+        """Test that an object surrounded by prose is found."""
+        text = 'Here is the result: {"success": true, "uri": "spotify:track:abc"} Done.'
+
+        assert _find_json_object(text) == {"success": True, "uri": "spotify:track:abc"}
+
+    def test_braces_inside_strings(self):
+        """Test that braces inside JSON strings do not end the object."""
+        text = 'Answer: {"reasoning": "matched {remastered} version }", "success": true}'
+
+        assert _find_json_object(text) == {
+            "reasoning": "matched {remastered} version }",
+            "success": True,
+        }
+
+    def test_escaped_quotes_inside_strings(self):
+        """Test that escaped quotes do not end a string early."""
+        text = r'{"reasoning": "title \"Song {live}\" matched", "success": false}'
+
+        assert _find_json_object(text) == {
+            "reasoning": 'title "Song {live}" matched',
+            "success": False,
+        }
+
+    def test_nested_objects(self):
+        """Test that a nested object is returned whole rather than its inner part."""
+        text = 'Result {"success": true, "track": {"name": "Song", "artist": "Artist"}}'
+
+        assert _find_json_object(text) == {
+            "success": True,
+            "track": {"name": "Song", "artist": "Artist"},
+        }
+
+    def test_last_object_wins(self):
+        """Test that the final answer is preferred over earlier tool-call JSON."""
+        text = (
+            'Calling search_track with {"query": "Song"}.\n'
+            'Final answer: {"success": true, "uri": "spotify:track:abc"}'
+        )
+
+        assert _find_json_object(text) == {"success": True, "uri": "spotify:track:abc"}
+
+    def test_invalid_last_span_falls_back(self):
+        """Test that an unparseable last span falls back to the previous object."""
+        text = '{"success": true} and then {not json}'
+
+        assert _find_json_object(text) == {"success": True}
+
+    @pytest.mark.parametrize(
+        "text",
+        ["no json here", '{"success": true', "} stray closing brace", ""],
+    )
+    def test_no_balanced_object(self, text):
+        """Test that text without a complete object yields None."""
+        assert _find_json_object(text) is None
@@ -0,0 +1,330 @@
+"""Unit tests for AI disambiguation caching and request sharing."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from activities import ai_disambiguator
+from activities.ai_disambiguator import (
+    _ai_cache_key,
+    _disambiguate_single,
+    _request_batch_decisions,
+    ai_disambiguate_track_batch,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_ai_cache():
+    """Run every test against an empty decision cache."""
+    ai_disambiguator._ai_result_cache.clear()
+    ai_disambiguator._ai_inflight.clear()
+    yield
+    ai_disambiguator._ai_result_cache.clear()
+    ai_disambiguator._ai_inflight.clear()
+
+
+@pytest.fixture
+def ambiguous_match(make_song_metadata, make_spotify_track):
+    """A song with two close candidates, so the fuzzy fast path does not apply."""
+    candidates = [make_spotify_track(track_id="a"), make_spotify_track(track_id="b")]
+    fuzzy_scores = [{"track_id": "a", "score": 0.7}, {"track_id": "b", "score": 0.65}]
+    return make_song_metadata(), candidates, fuzzy_scores
+
+
+def _decision(track, method="ai"):
+    """Build an LLM decision for a track."""
+    return {
+        "is_match": True,
+        "confidence": 0.9,
+        "matched_track": track,
+        "match_method": method,
+        "reasoning": "Same recording",
+    }
+
+
+class TestAIResultCache:
+    """Tests for caching LLM decisions."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_served_from_cache(self, ambiguous_match):
+        """Test that an identical request reuses the cached decision."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        decide = AsyncMock(return_value=_decision(candidates[0]))
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide):
+            first = await _disambiguate_single(metadata, candidates, fuzzy_scores)
+            second = await _disambiguate_single(metadata, candidates, fuzzy_scores)
+
+        assert first == second
+        decide.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_decision_asked_again(self, ambiguous_match):
+        """Test that the LLM is asked again once a cached decision expires."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        decide = AsyncMock(return_value=_decision(candidates[0]))
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide), \
+                patch.object(ai_disambiguator._ai_result_cache, "ttl_seconds", 0):
+            await _disambiguate_single(metadata, candidates, fuzzy_scores)
+            await _disambiguate_single(metadata, candidates, fuzzy_scores)
+
+        assert decide.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_decision_not_cached(self, ambiguous_match):
+        """Test that unusable answers are retried rather than cached."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        decide = AsyncMock(return_value=_decision(None, method="ai_failed"))
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide):
+            await _disambiguate_single(metadata, candidates, fuzzy_scores)
+            await _disambiguate_single(metadata, candidates, fuzzy_scores)
+
+        assert decide.await_count == 2
+
+    def test_cache_key_depends_on_prompt_version(self, ambiguous_match):
+        """Test that bumping PROMPT_VERSION invalidates cached decisions."""
+        key = _ai_cache_key(*ambiguous_match)
+
+        with patch.object(ai_disambiguator, "PROMPT_VERSION", ai_disambiguator.PROMPT_VERSION + 1):
+            assert _ai_cache_key(*ambiguous_match) != key
+
+    def test_cache_key_depends_on_provider(self, ambiguous_match):
+        """Test that decisions are not shared between AI providers."""
+        with patch.object(ai_disambiguator.settings, "ai_provider", "langchain"):
+            langchain_key = _ai_cache_key(*ambiguous_match)
+        with patch.object(ai_disambiguator.settings, "ai_provider", "claude"):
+            claude_key = _ai_cache_key(*ambiguous_match)
+
+        assert langchain_key != claude_key
+        assert _ai_cache_key(*ambiguous_match) == _ai_cache_key(*ambiguous_match)
+
+
+class TestAIInflight:
+    """Tests for sharing one LLM call between identical concurrent requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self, ambiguous_match):
+        """Test that identical requests in flight together make one LLM call."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        release = asyncio.Event()
+        calls = 0
+
+        async def slow_decide(*args):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return _decision(candidates[0])
+
+        with patch.object(ai_disambiguator, "_decide_with_models", slow_decide):
+            requests = [
+                asyncio.create_task(_disambiguate_single(metadata, candidates, fuzzy_scores))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*requests)
+
+        assert calls == 1
+        assert all(r["matched_track"] is candidates[0] for r in results)
+        assert not ai_disambiguator._ai_inflight
+
+    @pytest.mark.asyncio
+    async def test_leader_failure_reaches_waiters(self, ambiguous_match):
+        """Test that a failing LLM call raises in every waiter and is not left in flight."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        release = asyncio.Event()
+
+        async def failing_decide(*args):
+            await release.wait()
+            raise ConnectionError("provider unavailable")
+
+        with patch.object(ai_disambiguator, "_decide_with_models", failing_decide):
+            requests = [
+                asyncio.create_task(_disambiguate_single(metadata, candidates, fuzzy_scores))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*requests, return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert not ai_disambiguator._ai_inflight
+
+    @pytest.mark.asyncio
+    async def test_request_after_failure_calls_again(self, ambiguous_match):
+        """Test that a request after a failed call starts a fresh LLM call."""
+        metadata, candidates, fuzzy_scores = ambiguous_match
+        decide = AsyncMock(
+            side_effect=[ConnectionError("provider unavailable"), _decision(candidates[0])]
+        )
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide):
+            with pytest.raises(ConnectionError):
+                await _disambiguate_single(metadata, candidates, fuzzy_scores)
+            result = await _disambiguate_single(metadata, candidates, fuzzy_scores)
+
+        assert result["matched_track"] is candidates[0]
+        assert decide.await_count == 2
+
+
+class TestDominantFuzzyMatch:
+    """Tests for skipping the LLM when one fuzzy candidate clearly wins.
+
+    The workflow only asks for AI help when the best fuzzy score is below the
+    request's match_threshold, so these cases arise for strict thresholds
+    such as 0.95.
+    """
+
+    @pytest.mark.asyncio
+    async def test_decisive_fuzzy_match_skips_llm(self, make_song_metadata, make_spotify_track):
+        """Test that a high, well-separated fuzzy score is accepted without the LLM."""
+        candidates = [make_spotify_track(track_id="a"), make_spotify_track(track_id="b")]
+        fuzzy_scores = [{"track_id": "b", "score": 0.94}, {"track_id": "a", "score": 0.6}]
+        decide = AsyncMock()
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide):
+            result = await _disambiguate_single(make_song_metadata(), candidates, fuzzy_scores)
+
+        decide.assert_not_awaited()
+        assert result["matched_track"] is candidates[1]
+        assert result["match_method"] == "fuzzy_high_confidence"
+        assert result["confidence"] == 0.94
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "scores",
+        [(0.9, 0.5), (0.95, 0.85)],
+        ids=["below_min_score", "runner_up_too_close"],
+    )
+    async def test_contested_fuzzy_match_asks_llm(
+        self, make_song_metadata, make_spotify_track, scores
+    ):
+        """Test that a low or closely contested top score still goes to the LLM."""
+        candidates = [make_spotify_track(track_id="a"), make_spotify_track(track_id="b")]
+        fuzzy_scores = [
+            {"track_id": "a", "score": scores[0]},
+            {"track_id": "b", "score": scores[1]},
+        ]
+        decide = AsyncMock(return_value=_decision(candidates[0]))
+
+        with patch.object(ai_disambiguator, "_decide_with_models", decide):
+            await _disambiguate_single(make_song_metadata(), candidates, fuzzy_scores)
+
+        decide.assert_awaited_once()
+
+
+def _batch_items(make_song_metadata, make_spotify_track, count):
+    """Build batch items, each with two close candidates of its own."""
+    return [
+        (
+            make_song_metadata(title=f"Song {n}"),
+            [make_spotify_track(track_id=f"{n}a"), make_spotify_track(track_id=f"{n}b")],
+            [{"track_id": f"{n}a", "score": 0.7}, {"track_id": f"{n}b", "score": 0.65}],
+        )
+        for n in range(1, count + 1)
+    ]
+
+
+def _llm_replying(content):
+    """Build a LangChain LLM whose bound model replies with the given content."""
+    llm = Mock()
+    llm.bind.return_value.ainvoke = AsyncMock(return_value=SimpleNamespace(content=content))
+    return llm
+
+
+async def _first_candidate_decision(metadata, candidates, fuzzy_scores):
+    """Stand-in for _decide_with_models that always picks the first candidate."""
+    return _decision(candidates[0])
+
+
+class TestRequestBatchDecisions:
+    """Tests for parsing a multi-song LLM answer."""
+
+    @pytest.mark.asyncio
+    async def test_parses_json_array(self, make_song_metadata, make_spotify_track):
+        """Test that decisions are read from a fenced array, skipping malformed entries."""
+        content = """```json
+[
+  {"song_index": 1, "uri": " spotify:track:1a ", "reason": "Same recording."},
+  {"song_index": 2, "uri": "NONE", "reason": "Only live versions."},
+  {"song_index": "3", "uri": "spotify:track:3a", "reason": "Index is not a number."},
+  {"song_index": 4, "reason": "No URI."},
+  "not an object"
+]
+```"""
+        items = _batch_items(make_song_metadata, make_spotify_track, 4)
+
+        llm = _llm_replying(content)
+
+        with patch.object(ai_disambiguator.settings, "ai_provider", "langchain"), \
+                patch.object(ai_disambiguator, "_get_openai_llm", return_value=llm):
+            decisions = await _request_batch_decisions(items)
+
+        assert decisions == {
+            1: {"uri": "spotify:track:1a", "reason": "Same recording."},
+            2: {"uri": "NONE", "reason": "Only live versions."},
+        }
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "content",
+        ["I could not decide.", '[{"song_index": 1, "uri": ', '{"song_index": 1}'],
+        ids=["prose", "truncated", "object_not_array"],
+    )
+    async def test_malformed_response_raises(self, make_song_metadata, make_spotify_track, content):
+        """Test that a response without a parseable array raises ValueError."""
+        items = _batch_items(make_song_metadata, make_spotify_track, 2)
+
+        llm = _llm_replying(content)
+
+        with patch.object(ai_disambiguator.settings, "ai_provider", "langchain"), \
+                patch.object(ai_disambiguator, "_get_openai_llm", return_value=llm):
+            with pytest.raises(ValueError):
+                await _request_batch_decisions(items)
+
+
+class TestAIDisambiguateTrackBatch:
+    """Tests for falling back to single-song requests when a batch answer falls short."""
+
+    @pytest.mark.asyncio
+    async def test_partial_answer_falls_back_per_song(self, make_song_metadata, make_spotify_track):
+        """Test that unanswered songs and invalid URIs are asked again one at a time."""
+        items = _batch_items(make_song_metadata, make_spotify_track, 3)
+        decisions = {
+            1: {"uri": "spotify:track:1b", "reason": "Studio version."},
+            2: {"uri": "spotify:track:9z", "reason": "Not one of this song's candidates."},
+        }
+        single = AsyncMock(side_effect=_first_candidate_decision)
+
+        with patch.object(
+            ai_disambiguator, "_request_batch_decisions", AsyncMock(return_value=decisions)
+        ), patch.object(ai_disambiguator, "_decide_with_models", single):
+            results = await ai_disambiguate_track_batch(items)
+
+        assert results[0]["matched_track"] is items[0][1][1]
+        assert results[0]["reasoning"] == "Studio version."
+        assert [call.args[0].title for call in single.await_args_list] == ["Song 2", "Song 3"]
+        assert results[1]["matched_track"] is items[1][1][0]
+        assert results[2]["matched_track"] is items[2][1][0]
+
+    @pytest.mark.asyncio
+    async def test_malformed_answer_falls_back_for_every_song(
+        self, make_song_metadata, make_spotify_track
+    ):
+        """Test that every song is asked alone when the batch answer cannot be parsed."""
+        items = _batch_items(make_song_metadata, make_spotify_track, 2)
+        single = AsyncMock(side_effect=_first_candidate_decision)
+
+        with patch.object(
+            ai_disambiguator,
+            "_request_batch_decisions",
+            AsyncMock(side_effect=ValueError("AI batch response contains no JSON array")),
+        ), patch.object(ai_disambiguator, "_decide_with_models", single):
+            results = await ai_disambiguate_track_batch(items)
+
+        assert single.await_count == 2
+        assert [r["matched_track"] for r in results] == [items[0][1][0], items[1][1][0]]
@@ -0,0 +1,95 @@
+"""Unit tests for the agent API's in-memory execution store."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+pytest.importorskip("claude_agent_sdk")
+
+from agent_executor import AgentExecutionResult  # noqa: E402
+from api import app_agent  # noqa: E402
+from api.app_agent import _Execution, app, execution_results  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    """Test client over an empty execution store."""
+    execution_results.clear()
+    yield TestClient(app)
+    execution_results.clear()
+
+
+def _completed_execution() -> _Execution:
+    """Build a finished, successful agent execution."""
+    result = AgentExecutionResult(
+        success=True,
+        message="Added track",
+        matched_track_uri="spotify:track:abc",
+        confidence_score=0.9,
+        match_method="agent",
+        execution_time_seconds=1.5,
+    )
+    return _Execution(datetime(2025, 11, 9, 10, 30, 0), result, datetime(2025, 11, 9, 10, 30, 2))
+
+
+class TestExecutionResults:
+    """Tests for expiry and eviction of stored agent executions."""
+
+    def test_completed_execution_reported(self, client):
+        """Test that a stored execution is served by the status endpoint."""
+        execution_results.set("agent-sync-1", _completed_execution())
+
+        data = client.get("/api/v1/sync/agent-sync-1").json()
+
+        assert data["status"] == "completed"
+        assert data["result"]["spotify_track_id"] == "abc"
+
+    def test_expired_execution_forgotten(self, client):
+        """Test that an execution older than the TTL is no longer reported."""
+        with patch.object(app_agent.execution_results, "ttl_seconds", 0):
+            execution_results.set("agent-sync-1", _completed_execution())
+
+        data = client.get("/api/v1/sync/agent-sync-1").json()
+
+        assert data["status"] != "completed"
+        assert len(execution_results) == 0
+
+    def test_least_recently_polled_execution_evicted(self, client):
+        """Test that the execution polled least recently is evicted when the store is full."""
+        with patch.object(app_agent.execution_results, "max_entries", 2):
+            execution_results.set("agent-sync-1", _completed_execution())
+            execution_results.set("agent-sync-2", _completed_execution())
+            client.get("/api/v1/sync/agent-sync-1")
+            execution_results.set("agent-sync-3", _completed_execution())
+
+            statuses = {
+                workflow_id: client.get(f"/api/v1/sync/{workflow_id}").json()["status"]
+                for workflow_id in ("agent-sync-1", "agent-sync-2", "agent-sync-3")
+            }
+
+        # The endpoint reports workflows it no longer knows about as running
+        assert statuses == {
+            "agent-sync-1": "completed",
+            "agent-sync-2": "running",
+            "agent-sync-3": "completed",
+        }
+
+
+class TestCORS:
+    """Tests for CORS handling with and without an Origin header."""
+
+    def test_request_without_origin_varies_on_origin(self, client):
+        """Test that origin-less responses skip CORS headers but still vary on Origin."""
+        response = client.get("/health")
+
+        assert "access-control-allow-origin" not in response.headers
+        assert response.headers["vary"] == "Origin"
+
+    def test_browser_request_gets_cors_headers(self, client):
+        """Test that requests with an Origin header get CORS headers."""
+        response = client.get("/health", headers={"Origin": "https://example.com"})
+
+        assert response.headers["access-control-allow-origin"] == "https://example.com"
+        assert "Origin" in response.headers["vary"]
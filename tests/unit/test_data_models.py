@@ -75,6 +75,13 @@ class TestSongMetadata:
         assert song1 == song2
         assert song1 != song3
 
+    def test_immutable(self):
+        """Test that SongMetadata fields cannot be reassigned."""
+        song = SongMetadata(title="Test", artist="Artist")
+
+        with pytest.raises(AttributeError):
+            song.title = "Other"
+
 
 class TestSpotifyTrackResult:
     """Tests for SpotifyTrackResult dataclass."""
@@ -0,0 +1,189 @@
+"""Unit tests for the MCP client wrapper."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import anyio
+import pytest
+
+from mcp_client import client as client_module
+from mcp_client.client import SpotifyMCPClient, TransientToolError, _is_transport_error
+
+
+def _tool_result(payload: dict) -> SimpleNamespace:
+    """Build an MCP call_tool result carrying a JSON payload."""
+    return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(payload))])
+
+
+def _connected_client(call_tool: AsyncMock) -> SpotifyMCPClient:
+    """Build a client that looks connected, backed by a mocked session."""
+    client = SpotifyMCPClient()
+    client.session = SimpleNamespace(call_tool=call_tool)
+    client._alive = True
+    return client
+
+
+class TestCallTool:
+    """Tests for SpotifyMCPClient.call_tool error handling."""
+
+    @pytest.mark.asyncio
+    async def test_returns_parsed_result(self):
+        """Test that a successful tool result is parsed from JSON."""
+        client = _connected_client(AsyncMock(return_value=_tool_result({"tracks": []})))
+
+        assert await client.call_tool("search_track", {"query": "q"}) == {"tracks": []}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("http_status", [429, 500, 503])
+    async def test_rate_limits_and_server_errors_are_transient(self, http_status):
+        """Test that Spotify rate limits and 5xx responses raise TransientToolError."""
+        client = _connected_client(
+            AsyncMock(return_value=_tool_result({"error": "boom", "http_status": http_status}))
+        )
+
+        with pytest.raises(TransientToolError):
+            await client.call_tool("search_track", {"query": "q"})
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("http_status", [None, 400, 403, 404])
+    async def test_other_tool_errors_are_permanent(self, http_status):
+        """Test that other tool errors raise a plain ValueError."""
+        client = _connected_client(
+            AsyncMock(return_value=_tool_result({"error": "Not found", "http_status": http_status}))
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            await client.call_tool("add_track_to_playlist", {})
+
+        assert not isinstance(exc_info.value, TransientToolError)
+        assert client.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_raises_connection_error(self):
+        """Test that a closed server connection surfaces as a retryable ConnectionError."""
+
+        class ConnectionClosed(Exception):
+            error = SimpleNamespace(code=-32000)
+
+        client = _connected_client(AsyncMock(side_effect=ConnectionClosed("Connection closed")))
+
+        with pytest.raises(ConnectionError):
+            await client.call_tool("search_track", {"query": "q"})
+
+        assert not client.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_broken_pipe_marks_client_dead(self):
+        """Test that an OS-level transport failure is re-raised and marks the client dead."""
+        client = _connected_client(AsyncMock(side_effect=BrokenPipeError("pipe closed")))
+
+        with pytest.raises(BrokenPipeError):
+            await client.call_tool("search_track", {"query": "q"})
+
+        assert not client.is_alive()
+
+
+class TestIsTransportError:
+    """Tests for telling connection failures apart from other errors."""
+
+    @pytest.mark.parametrize(
+        "error",
+        [ConnectionResetError(), BrokenPipeError(), anyio.ClosedResourceError()],
+    )
+    def test_transport_errors(self, error):
+        """Test that stream and OS errors count as a lost connection."""
+        assert _is_transport_error(error)
+
+    @pytest.mark.parametrize("error", [ValueError("bad"), RuntimeError("other")])
+    def test_other_errors(self, error):
+        """Test that unrelated errors do not count as a lost connection."""
+        assert not _is_transport_error(error)
+
+
+class _FakeSession:
+    """Stand-in for ClientSession that records whether it was entered and exited."""
+
+    instances = []
+
+    def __init__(self, read_stream, write_stream):
+        self.initialize = AsyncMock()
+        self.exited = False
+        _FakeSession.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.exited = True
+
+
+@asynccontextmanager
+async def _fake_stdio(server_params):
+    """Stand-in for stdio_client yielding dummy streams."""
+    yield object(), object()
+
+
+class TestConnection:
+    """Tests for connecting to and disconnecting from the MCP server."""
+
+    @pytest.mark.asyncio
+    async def test_connect_and_close(self):
+        """Test that close() shuts the session down from the connection task."""
+        _FakeSession.instances.clear()
+        client = SpotifyMCPClient()
+
+        with patch.object(client_module, "stdio_client", _fake_stdio), \
+                patch.object(client_module, "ClientSession", _FakeSession):
+            await client.connect()
+            session = _FakeSession.instances[0]
+
+            assert client.is_alive()
+            session.initialize.assert_awaited_once()
+
+            await client.close()
+
+        assert session.exited
+        assert not client.is_alive()
+        assert client.session is None
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_raised(self):
+        """Test that a server that fails to start surfaces its error from connect()."""
+
+        @asynccontextmanager
+        async def failing_stdio(server_params):
+            raise FileNotFoundError("python")
+            yield
+
+        client = SpotifyMCPClient()
+
+        with patch.object(client_module, "stdio_client", failing_stdio):
+            with pytest.raises(FileNotFoundError):
+                await client.connect()
+
+        assert not client.is_alive()
+        assert client._connection_task is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_connection_fails_connect(self):
+        """Test that connect() fails instead of hanging if the connection task is cancelled."""
+        started = asyncio.Event()
+
+        @asynccontextmanager
+        async def hanging_stdio(server_params):
+            started.set()
+            await asyncio.Event().wait()
+            yield
+
+        client = SpotifyMCPClient()
+
+        with patch.object(client_module, "stdio_client", hanging_stdio):
+            connecting = asyncio.create_task(client.connect())
+            await started.wait()
+            client._connection_task.cancel()
+
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(connecting, timeout=1)
@@ -0,0 +1,92 @@
+"""Unit tests for the playlist management activities."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from temporalio.exceptions import ApplicationError
+
+from activities import playlist_manager
+from activities.playlist_manager import _classify_playlist_error, add_tracks_to_playlist
+from mcp_client.client import TransientToolError
+
+
+@pytest.fixture
+def mcp_client():
+    """Mocked MCP client returned by get_spotify_mcp_client."""
+    client = AsyncMock()
+    with patch.object(playlist_manager, "get_spotify_mcp_client", AsyncMock(return_value=client)):
+        yield client
+
+
+class TestAddTracksToPlaylist:
+    """Tests for the add-tracks-batch activity."""
+
+    @pytest.mark.asyncio
+    async def test_adds_only_missing_tracks(self, mcp_client):
+        """Test that tracks already in the playlist are skipped and the rest added at once."""
+        mcp_client.list_playlist_tracks.return_value = ["spotify:track:a"]
+        mcp_client.add_tracks_to_playlist.return_value = {"snapshot_id": "snap"}
+
+        result = await add_tracks_to_playlist(
+            ["spotify:track:a", "spotify:track:b", "spotify:track:b"], "playlist", "user"
+        )
+
+        mcp_client.add_tracks_to_playlist.assert_awaited_once_with(["spotify:track:b"], "playlist")
+        assert result["added"] == ["spotify:track:b"]
+        assert result["already_exists"] == ["spotify:track:a"]
+
+    @pytest.mark.asyncio
+    async def test_empty_list_makes_no_calls(self, mcp_client):
+        """Test that an empty batch returns without touching Spotify."""
+        result = await add_tracks_to_playlist([], "playlist", "user")
+
+        assert result == {"status": "already_exists", "added": [], "already_exists": []}
+        mcp_client.list_playlist_tracks.assert_not_awaited()
+        mcp_client.add_tracks_to_playlist.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_missing_playlist_not_retried(self, mcp_client):
+        """Test that a missing playlist fails the activity without retries."""
+        mcp_client.list_playlist_tracks.side_effect = ValueError(
+            "Tool returned error: Playlist not found"
+        )
+
+        with pytest.raises(ApplicationError) as exc_info:
+            await add_tracks_to_playlist(["spotify:track:a"], "playlist", "user")
+
+        assert exc_info.value.non_retryable
+
+
+class TestClassifyPlaylistError:
+    """Tests for mapping playlist write failures to retry semantics."""
+
+    @pytest.mark.parametrize(
+        "error, error_type",
+        [
+            (ValueError("Tool returned error: Playlist not found"), "PlaylistNotFoundError"),
+            (ValueError("Tool returned error: Insufficient client scope"), "InsufficientScopeError"),
+        ],
+    )
+    def test_permanent_errors(self, error, error_type):
+        """Test that missing playlists and scopes are not retried."""
+        classified = _classify_playlist_error(error, "playlist", "Failed to add tracks")
+
+        assert isinstance(classified, ApplicationError)
+        assert classified.non_retryable
+        assert classified.type == error_type
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ConnectionError("MCP server connection lost"),
+            TimeoutError(),
+            TransientToolError("Tool returned error: rate limited"),
+            ValueError("Tool returned error: something else"),
+        ],
+    )
+    def test_retryable_errors(self, error):
+        """Test that connection problems and other tool errors are retried."""
+        classified = _classify_playlist_error(error, "playlist", "Failed to add tracks")
+
+        assert isinstance(classified, ApplicationError)
+        assert not classified.non_retryable
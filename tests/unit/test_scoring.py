@@ -0,0 +1,46 @@
+"""Unit tests for the shared fuzzy scoring helpers."""
+
+import numpy as np
+import pytest
+from rapidfuzz import fuzz
+
+from activities.scoring import (
+    SCORE_WEIGHTS,
+    SCORE_WEIGHTS_NO_ALBUM,
+    combine_scores,
+    similarity_scores,
+)
+
+
+class TestSimilarityScores:
+    """Tests for batched similarity scoring."""
+
+    def test_scores_align_with_choices(self):
+        """Test that repeated, identical and empty choices score per position."""
+        scores = similarity_scores("queen", ["queen", "", "queens", "queen"])
+
+        assert scores[0] == scores[3] == 1.0
+        assert scores[1] == 0.0
+        assert scores[2] == pytest.approx(fuzz.ratio("queen", "queens") / 100.0)
+
+
+class TestCombineScores:
+    """Tests for weighting component scores."""
+
+    def test_weights_sum_to_one(self):
+        """Test that both weightings give a perfect candidate a score of 1.0."""
+        assert sum(SCORE_WEIGHTS) == pytest.approx(1.0)
+        assert sum(SCORE_WEIGHTS_NO_ALBUM) == pytest.approx(1.0)
+
+    def test_isrc_match_scores_perfect(self):
+        """Test that an ISRC match wins regardless of its string scores."""
+        combined, best_idx, best_score = combine_scores(
+            title=np.array([0.9, 0.1]),
+            artist=np.array([0.9, 0.1]),
+            album=np.array([0.9, 0.1]),
+            isrc_match=np.array([False, True]),
+        )
+
+        assert best_idx == 1
+        assert best_score == 1.0
+        assert combined[0] == pytest.approx(0.9)
@@ -35,17 +35,23 @@ class TestSettings:
 
         assert settings.spotify_redirect_uri == "http://127.0.0.1:8888/callback"
         assert settings.ai_model == "gpt-4"
+        assert settings.ai_model_small is None
+        assert settings.claude_model_small is None
         assert settings.temporal_host == "localhost:7233"
         # Note: conftest.py sets TEMPORAL_NAMESPACE="test" for test environment
         assert settings.temporal_namespace in ["default", "test"]
         assert settings.api_host == "0.0.0.0"
         assert settings.api_port == 8000
         assert settings.api_workers == 4
+        assert settings.event_loop == "auto"
         assert settings.fuzzy_match_threshold == 0.85
         assert settings.use_ai_disambiguation is True
+        assert settings.ai_max_candidates == 5
         assert settings.max_concurrent_activities == 100
         assert settings.max_concurrent_workflows == 50
         assert settings.max_activities_per_second == 10.0
+        assert settings.standalone_workers == 8
+        assert settings.standalone_queue_size == 1000
         # Log level may be overridden in test environment
         assert settings.log_level in ["INFO", "ERROR"]
         assert settings.task_queue_name == "music-sync-queue"
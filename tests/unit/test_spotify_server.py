@@ -0,0 +1,52 @@
+"""Unit tests for the Spotify MCP server's tool handlers."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcp_server import spotify_server
+
+
+def _payload(response):
+    """Decode the JSON payload of a tool response."""
+    return json.loads(response[0]["text"])
+
+
+class TestAddTracksToPlaylist:
+    """Tests for the add_tracks_to_playlist tool."""
+
+    @pytest.mark.asyncio
+    async def test_uris_sent_in_chunks_of_100(self):
+        """Test that large batches are split into Spotify's 100-URI request limit."""
+        spotify = Mock()
+        spotify.playlist_add_items.side_effect = [
+            {"snapshot_id": "s1"}, {"snapshot_id": "s2"}, {"snapshot_id": "s3"}
+        ]
+        track_uris = [f"spotify:track:{i}" for i in range(250)]
+
+        with patch.object(spotify_server, "spotify_client", spotify):
+            response = await spotify_server.call_tool(
+                "add_tracks_to_playlist", {"playlist_id": "playlist", "track_uris": track_uris}
+            )
+
+        chunks = [c.args[1] for c in spotify.playlist_add_items.call_args_list]
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        assert sum(chunks, []) == track_uris
+        assert _payload(response) == {"snapshot_id": "s3"}
+
+    @pytest.mark.asyncio
+    async def test_spotify_error_reports_http_status(self):
+        """Test that a failed request reports Spotify's HTTP status for retry decisions."""
+        error = Exception("rate limited")
+        error.http_status = 429
+        spotify = Mock()
+        spotify.playlist_add_items.side_effect = error
+
+        with patch.object(spotify_server, "spotify_client", spotify):
+            response = await spotify_server.call_tool(
+                "add_tracks_to_playlist",
+                {"playlist_id": "playlist", "track_uris": ["spotify:track:a"]},
+            )
+
+        assert _payload(response)["http_status"] == 429
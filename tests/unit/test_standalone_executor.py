@@ -0,0 +1,327 @@
+"""Unit tests for the standalone (Temporal-free) workflow executor."""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from executors import standalone_executor
+from executors.standalone_executor import (
+    MCP_RETRYABLE_ERRORS,
+    AIDisambiguationBatcher,
+    StandaloneWorkflowState,
+    _ai_disambiguate_batch,
+    _finish_workflow_state,
+    _store_workflow_state,
+    execute_with_retry,
+    search_spotify_standalone,
+    workflow_status_store,
+)
+from mcp_client.client import TransientToolError
+
+
+@pytest.fixture
+def no_retry_sleep():
+    """Skip retry back-off delays."""
+    with patch.object(standalone_executor.asyncio, "sleep", AsyncMock()):
+        yield
+
+
+@pytest.mark.usefixtures("no_retry_sleep")
+class TestExecuteWithRetry:
+    """Tests for execute_with_retry under the MCP retry policy."""
+
+    @pytest.mark.asyncio
+    async def test_permanent_tool_error_not_retried(self):
+        """Test that a permanent MCP tool error fails on the first attempt."""
+        func = AsyncMock(side_effect=ValueError("Tool returned error: Playlist not found"))
+
+        with pytest.raises(ValueError):
+            await execute_with_retry(func, max_attempts=5, retry_on=MCP_RETRYABLE_ERRORS)
+
+        assert func.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [TransientToolError("rate limited"), ConnectionError("lost"), TimeoutError()],
+    )
+    async def test_transient_errors_retried(self, error):
+        """Test that transient failures are retried until the call succeeds."""
+        func = AsyncMock(side_effect=[error, "ok"])
+
+        result = await execute_with_retry(func, max_attempts=3, retry_on=MCP_RETRYABLE_ERRORS)
+
+        assert result == "ok"
+        assert func.await_count == 2
+
+
+def _ai_result(track=None, reasoning="ok"):
+    """Build an AI disambiguation result dictionary."""
+    return {
+        "is_match": track is not None,
+        "confidence": 0.9 if track is not None else 0.0,
+        "matched_track": track,
+        "match_method": "ai",
+        "reasoning": reasoning,
+    }
+
+
+async def _run_batch(batcher, requests):
+    """Run requests through one batch and return each request's result."""
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in requests]
+    await batcher._run_batch([(*req, fut) for req, fut in zip(requests, futures)])
+    return [fut.result() for fut in futures]
+
+
+class TestAIDisambiguationBatcher:
+    """Tests for grouping concurrent AI disambiguation requests."""
+
+    @pytest.mark.asyncio
+    async def test_lone_request_sent_immediately(self, make_song_metadata, make_spotify_track):
+        """Test that a single request takes the single-song path without waiting."""
+        track = make_spotify_track()
+        single = AsyncMock(return_value=_ai_result(track))
+        batch = AsyncMock()
+
+        with patch.object(standalone_executor, "ai_disambiguate_standalone", single), \
+                patch.object(standalone_executor, "_ai_disambiguate_batch", batch):
+            result = await asyncio.wait_for(
+                AIDisambiguationBatcher().submit(make_song_metadata(), [track], [0.8]),
+                timeout=0.1,
+            )
+
+        assert result["matched_track"] is track
+        single.assert_awaited_once()
+        batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_requests_queued_behind_busy_slot_share_one_call(
+        self, make_song_metadata, make_spotify_track
+    ):
+        """Test that requests arriving while all slots are busy go out as one batch."""
+        release = asyncio.Event()
+        track_a = make_spotify_track(track_id="a")
+        track_b = make_spotify_track(track_id="b")
+
+        async def slow_single(metadata, candidates, scores):
+            await release.wait()
+            return _ai_result(candidates[0])
+
+        batch = AsyncMock(return_value={1: _ai_result(track_a), 2: _ai_result(track_b)})
+        batcher = AIDisambiguationBatcher(concurrency=1)
+
+        with patch.object(standalone_executor, "ai_disambiguate_standalone", slow_single), \
+                patch.object(standalone_executor, "_ai_disambiguate_batch", batch):
+            first = asyncio.create_task(
+                batcher.submit(make_song_metadata(title="First"), [track_a], [0.5])
+            )
+            await asyncio.sleep(0)
+            queued = [
+                asyncio.create_task(batcher.submit(make_song_metadata(title=t), [trk], [0.5]))
+                for t, trk in (("Second", track_a), ("Third", track_b))
+            ]
+            await asyncio.sleep(0)
+            batch.assert_not_awaited()
+
+            release.set()
+            results = await asyncio.gather(first, *queued)
+
+        batch.assert_awaited_once()
+        assert [req[0].title for req in batch.await_args.args[0]] == ["Second", "Third"]
+        assert [r["matched_track"] for r in results] == [track_a, track_a, track_b]
+
+    @pytest.mark.asyncio
+    async def test_skipped_songs_asked_again_alone(self, make_song_metadata, make_spotify_track):
+        """Test that songs missing from a batch answer go through the single-song path."""
+        track_a = make_spotify_track(track_id="a")
+        track_b = make_spotify_track(track_id="b")
+        batch = AsyncMock(return_value={1: _ai_result(track_a)})
+        single = AsyncMock(return_value=_ai_result(track_b, reasoning="asked alone"))
+        batcher = AIDisambiguationBatcher()
+
+        with patch.object(standalone_executor, "ai_disambiguate_standalone", single), \
+                patch.object(standalone_executor, "_ai_disambiguate_batch", batch):
+            results = await _run_batch(
+                batcher,
+                [
+                    (make_song_metadata(title="One"), [track_a], [0.5]),
+                    (make_song_metadata(title="Two"), [track_b], [0.5]),
+                ],
+            )
+
+        assert results[0]["matched_track"] is track_a
+        assert results[1]["reasoning"] == "asked alone"
+        single.assert_awaited_once()
+        assert single.await_args.args[0].title == "Two"
+
+    @pytest.mark.asyncio
+    async def test_batch_answer_parsing(self, make_song_metadata, make_spotify_track):
+        """Test parsing of SONG/URI/REASON blocks from a multi-song answer."""
+        track_a = make_spotify_track(track_id="a")
+        track_b = make_spotify_track(track_id="b")
+        requests = [
+            (make_song_metadata(title=title), [track], [0.5])
+            for title, track in (
+                ("One", track_a), ("Two", track_b), ("Three", track_a), ("Four", track_b)
+            )
+        ]
+        answer = (
+            "SONG: 1\nURI: spotify:track:a\nREASON: Same recording.\n\n"
+            "SONG: 2\nURI: NONE\nREASON: Only a live version.\n\n"
+            "SONG: 3\nURI: spotify:track:b\nREASON: Wrong list.\n\n"
+            "SONG: 9\nURI: spotify:track:a\nREASON: Out of range.\n"
+        )
+        llm = SimpleNamespace(ainvoke=AsyncMock(return_value=SimpleNamespace(content=answer)))
+
+        with patch.object(standalone_executor.settings, "ai_provider", "langchain"), \
+                patch.object(standalone_executor, "_get_openai_llm", return_value=llm):
+            results = await _ai_disambiguate_batch(requests)
+
+        assert set(results) == {1, 2, 3}
+        assert results[1]["is_match"] is True
+        assert results[1]["matched_track"] is track_a
+        assert results[1]["reasoning"] == "Same recording."
+        assert results[2]["is_match"] is False
+        assert results[2]["reasoning"] == "Only a live version."
+        # A URI from another song's candidate list is rejected
+        assert results[3]["match_method"] == "ai_failed"
+
+
+@pytest.fixture
+def empty_workflow_store():
+    """Run against an empty workflow status store."""
+    workflow_status_store.clear()
+    standalone_executor._finished_workflows.clear()
+    yield
+    workflow_status_store.clear()
+    standalone_executor._finished_workflows.clear()
+
+
+def _workflow_state(workflow_id, started_monotonic=0.0):
+    """Build a running workflow state."""
+    return StandaloneWorkflowState(
+        workflow_id=workflow_id,
+        current_step="searching",
+        candidates_found=0,
+        started_at=datetime.now(),
+        started_monotonic=started_monotonic,
+        status="running",
+    )
+
+
+@pytest.mark.usefixtures("empty_workflow_store")
+class TestWorkflowStatusStore:
+    """Tests for pruning and eviction of stored workflow states."""
+
+    def test_ttl_counts_from_completion(self):
+        """Test that a long-running workflow is kept for the TTL after it finishes."""
+        ttl = standalone_executor.FINISHED_WORKFLOW_TTL_SECONDS
+        with patch.object(standalone_executor.time, "monotonic", return_value=0.0):
+            _store_workflow_state(_workflow_state("long"))
+        with patch.object(standalone_executor.time, "monotonic", return_value=ttl * 2):
+            _finish_workflow_state(workflow_status_store["long"], "completed")
+            _store_workflow_state(_workflow_state("next", started_monotonic=ttl * 2))
+
+        assert "long" in workflow_status_store
+
+        with patch.object(standalone_executor.time, "monotonic", return_value=ttl * 3 + 1):
+            _store_workflow_state(_workflow_state("later"))
+
+        assert "long" not in workflow_status_store
+        assert "next" in workflow_status_store
+
+    def test_size_cap_evicts_only_finished_workflows(self):
+        """Test that the size cap drops finished entries and never running ones."""
+        with patch.object(standalone_executor, "MAX_STORED_WORKFLOWS", 2):
+            _store_workflow_state(_workflow_state("running"))
+            _store_workflow_state(_workflow_state("done"))
+            _finish_workflow_state(workflow_status_store["done"], "failed")
+            _store_workflow_state(_workflow_state("new"))
+
+            assert list(workflow_status_store) == ["running", "new"]
+
+            # With nothing finished to evict, running workflows stay past the cap
+            _store_workflow_state(_workflow_state("another"))
+
+        assert list(workflow_status_store) == ["running", "new", "another"]
+
+
+@pytest.fixture
+def empty_search_cache():
+    """Run against an empty search cache."""
+    standalone_executor._search_cache.clear()
+    yield
+    standalone_executor._search_cache.clear()
+
+
+@pytest.mark.usefixtures("empty_search_cache")
+class TestSearchCache:
+    """Tests for caching and sharing Spotify search results."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_served_from_cache(
+        self, make_song_metadata, make_spotify_track
+    ):
+        """Test that a repeated search reuses the cached result."""
+        fetch = AsyncMock(return_value=[make_spotify_track()])
+
+        with patch.object(standalone_executor, "_fetch_spotify_tracks", fetch):
+            first = await search_spotify_standalone(make_song_metadata())
+            second = await search_spotify_standalone(make_song_metadata())
+
+        assert first == second
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_fetched_again(self, make_song_metadata, make_spotify_track):
+        """Test that a search is repeated once its cached result expires."""
+        fetch = AsyncMock(return_value=[make_spotify_track()])
+
+        with patch.object(standalone_executor, "_fetch_spotify_tracks", fetch), \
+                patch.object(standalone_executor._search_cache, "ttl_seconds", 0):
+            await search_spotify_standalone(make_song_metadata())
+            await search_spotify_standalone(make_song_metadata())
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_results_not_cached(self, make_song_metadata):
+        """Test that a search with no results is not cached."""
+        fetch = AsyncMock(return_value=[])
+
+        with patch.object(standalone_executor, "_fetch_spotify_tracks", fetch):
+            await search_spotify_standalone(make_song_metadata())
+            await search_spotify_standalone(make_song_metadata())
+
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_share_one_fetch(
+        self, make_song_metadata, make_spotify_track
+    ):
+        """Test that identical searches in flight together issue one fetch."""
+        release = asyncio.Event()
+        track = make_spotify_track()
+        calls = 0
+
+        async def slow_fetch(metadata, search_query):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [track]
+
+        with patch.object(standalone_executor, "_fetch_spotify_tracks", slow_fetch):
+            searches = [
+                asyncio.create_task(search_spotify_standalone(make_song_metadata()))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*searches)
+
+        assert calls == 1
+        assert results == [[track]] * 3
@@ -0,0 +1,44 @@
+"""Unit tests for the TTL-bounded LRU cache."""
+
+from utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache lookups, expiry and eviction."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned until it expires."""
+        cache = TTLCache(ttl_seconds=60, max_entries=4)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_dropped(self):
+        """Test that an expired entry is treated as missing and removed."""
+        cache = TTLCache(ttl_seconds=0, max_entries=4)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_set_replaces_existing_entry(self):
+        """Test that setting a key again replaces its value without growing the cache."""
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("a", 2)
+
+        assert cache.get("a") == 2
+        assert len(cache) == 1
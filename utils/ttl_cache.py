@@ -0,0 +1,54 @@
+"""Small in-memory cache with per-entry expiry and least-recently-used eviction."""
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Size-bounded LRU cache whose entries expire a fixed time after being set.
+
+    Expired entries are dropped lazily when looked up, and the least recently
+    used entry is evicted once more than max_entries are stored. Not safe for
+    use from multiple threads; meant for a single event loop.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid after it is set
+            max_entries: Maximum number of entries kept
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value for a key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)